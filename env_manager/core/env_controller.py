@@ -5,6 +5,7 @@
 """
 
 from typing import Dict, List, Optional, Tuple, Callable
+from bisect import bisect_right
 from datetime import datetime
 from enum import Enum
 
@@ -15,6 +16,7 @@ from .exceptions import (
     RegistryAccessError, PermissionError, ValidationError,
     EnvManagerException
 )
+from ..utils.helpers import invalidate_path_cache
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -62,6 +64,10 @@ class EnvController:
         self._user_vars_cache: Optional[List[EnvironmentVariable]] = None
         self._cache_timestamp: Optional[datetime] = None
         self._cache_timeout = 60  # 缓存超时时间（秒）
+        
+        # 搜索索引: (变量列表, 小写变量名列, 名称起始偏移, 小写变量值列, 值起始偏移)，随变量缓存一起失效
+        self._search_index: Optional[Tuple[List[EnvironmentVariable], str, List[int], str, List[int]]] = None
+        self._search_index_stamp: Optional[datetime] = None
     
     def get_all_variables(self) -> List[EnvironmentVariable]:
         """获取所有环境变量"""
@@ -331,29 +337,25 @@ class EnvController:
                         search_in_value: bool = True, case_sensitive: bool = False) -> List[EnvironmentVariable]:
         """搜索环境变量"""
         try:
-            all_vars = self.get_all_variables()
-            results = []
-            
             if not query:
-                return all_vars
-            
-            search_query = query if case_sensitive else query.lower()
+                return self.get_all_variables()
             
-            for var in all_vars:
-                match = False
-                
+            if case_sensitive:
+                results = [
+                    var for var in self.get_all_variables()
+                    if (search_in_name and query in var.name)
+                    or (search_in_value and query in var.value)
+                ]
+            else:
+                # 不区分大小写时在缓存的小写列上查找，避免逐个变量比较
+                all_vars, names, name_starts, values, value_starts = self._get_search_index()
+                search_query = query.lower()
+                matched = set()
                 if search_in_name:
-                    name_to_search = var.name if case_sensitive else var.name.lower()
-                    if search_query in name_to_search:
-                        match = True
-                
-                if not match and search_in_value:
-                    value_to_search = var.value if case_sensitive else var.value.lower()
-                    if search_query in value_to_search:
-                        match = True
-                
-                if match:
-                    results.append(var)
+                    matched.update(self._find_in_column(names, name_starts, search_query))
+                if search_in_value:
+                    matched.update(self._find_in_column(values, value_starts, search_query))
+                results = [all_vars[i] for i in sorted(matched)]
             
             logger.debug(f"搜索环境变量 '{query}': 找到{len(results)}个结果")
             return results
@@ -365,6 +367,7 @@ class EnvController:
     def refresh_cache(self) -> None:
         """刷新缓存"""
         self._clear_cache()
+        invalidate_path_cache()
         logger.debug("环境变量缓存已刷新")
     
     def add_change_callback(self, callback: Callable[[str, EnvironmentVariable, Optional[str]], None]) -> None:
@@ -403,6 +406,49 @@ class EnvController:
         self._system_vars_cache = None
         self._user_vars_cache = None
         self._cache_timestamp = None
+        self._search_index = None
+    
+    def _get_search_index(self) -> Tuple[List[EnvironmentVariable], str, List[int], str, List[int]]:
+        """获取搜索索引，变量缓存重新加载后重建
+        
+        小写变量名和变量值各自拼接成一列，查找由str.find在整列上完成，
+        Python层的循环次数只与匹配数量有关。
+        """
+        all_vars = self.get_all_variables()
+        if self._search_index is None or self._search_index_stamp != self._cache_timestamp:
+            names, name_starts = self._build_search_column([var.name.lower() for var in all_vars])
+            values, value_starts = self._build_search_column([var.value.lower() for var in all_vars])
+            self._search_index = (all_vars, names, name_starts, values, value_starts)
+            self._search_index_stamp = self._cache_timestamp
+        return self._search_index
+    
+    @staticmethod
+    def _build_search_column(texts: List[str]) -> Tuple[str, List[int]]:
+        """用NUL连接文本，并返回每项的起始偏移"""
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        return "\0".join(texts), starts
+    
+    @staticmethod
+    def _find_in_column(column: str, starts: List[int], query: str) -> List[int]:
+        """在列中查找包含query的项，返回项的下标"""
+        if "\0" in query:
+            return []
+        
+        indices = []
+        count = len(starts)
+        pos = column.find(query)
+        while pos >= 0:
+            index = bisect_right(starts, pos) - 1
+            indices.append(index)
+            if index + 1 >= count:
+                break
+            # 每项只记录一次，从下一项开头继续查找
+            pos = column.find(query, starts[index + 1])
+        return indices
     
     def _notify_change(self, action: str, variable: EnvironmentVariable, old_value: Optional[str]) -> None:
         """通知变更"""
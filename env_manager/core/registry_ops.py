@@ -106,17 +106,19 @@ class RegistryOps:
     
     def env_var_exists(self, name: str, system: bool = False) -> bool:
         """检查环境变量是否存在"""
-        try:
-            env_vars = self.get_system_env_vars() if system else self.get_user_env_vars()
-            return name in env_vars
-        except Exception:
-            return False
+        return self.get_env_var_value(name, system) is not None
     
     def get_env_var_value(self, name: str, system: bool = False) -> Optional[str]:
-        """获取单个环境变量的值"""
+        """获取单个环境变量的值（只查询该值，不枚举整个键）"""
+        if system:
+            root_key, key_path = winreg.HKEY_LOCAL_MACHINE, self._system_key_path
+        else:
+            root_key, key_path = winreg.HKEY_CURRENT_USER, self._user_key_path
+        
         try:
-            env_vars = self.get_system_env_vars() if system else self.get_user_env_vars()
-            return env_vars.get(name)
+            with winreg.OpenKey(root_key, key_path, 0, winreg.KEY_READ) as key:
+                value, _ = winreg.QueryValueEx(key, name)
+                return value
         except Exception:
             return None
     
@@ -126,15 +128,15 @@ class RegistryOps:
         
         try:
             with winreg.OpenKey(root_key, key_path, 0, winreg.KEY_READ) as key:
-                i = 0
-                while True:
+                # 先取得值的数量，一次遍历完成枚举
+                value_count = winreg.QueryInfoKey(key)[1]
+                for i in range(value_count):
                     try:
                         name, value, _ = winreg.EnumValue(key, i)
-                        env_vars[name] = value
-                        i += 1
-                    except WindowsError:
-                        # 没有更多值了
+                    except OSError:
+                        # 枚举期间值被删除
                         break
+                    env_vars[name] = value
         except Exception as e:
             raise RegistryAccessError(f"无法读取注册表键 {key_path}: {e}")
         
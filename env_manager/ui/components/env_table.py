@@ -6,20 +6,233 @@
 
 from typing import List, Optional, Dict, Any
 from PySide6.QtWidgets import (
-    QTableWidget, QTableWidgetItem, QHeaderView, QMenu, QApplication,
+    QTableView, QHeaderView, QMenu, QApplication,
     QAbstractItemView, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QCheckBox, QComboBox, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QAction, QDrag, QPixmap, QPainter, QIcon
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QAbstractTableModel, QModelIndex, QSortFilterProxyModel,
+    QRegularExpression, QSignalBlocker
+)
+from PySide6.QtGui import QAction, QDrag, QPixmap, QPainter, QIcon, QColor
 
 from ...models.env_model import EnvironmentVariable, EnvType
-from ...utils.constants import TABLE_COLUMNS, SHORTCUTS, ENV_TYPES
+from ...utils.constants import TABLE_COLUMNS, ENV_TYPES
 from ...utils.logger import get_logger
+from ..shortcuts import KEY_SEQUENCES
 
 
-class EnvTableWidget(QTableWidget):
-    """自定义表格控件，支持拖拽和排序"""
+class EnvTableModel(QAbstractTableModel):
+    """环境变量表格数据模型
+    
+    每行的显示文本在设置数据时一次性计算，data()只做元组查找，
+    视图只会为可见区域请求数据。
+    """
+    
+    HEADERS = ["变量名", "变量值", "类型", "状态"]
+    
+    # 搜索过滤使用的角色：变量名列返回变量名，变量值列返回完整值
+    FILTER_ROLE = Qt.ItemDataRole.UserRole + 1
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._env_vars: List[EnvironmentVariable] = []
+        self._rows: List[tuple] = []  # (变量名, 显示值, 类型, 状态)
+        
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def headerData(self, section: int, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+        
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[row][column]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._env_vars[row]
+        if role == self.FILTER_ROLE:
+            if column == 0:
+                return self._env_vars[row].name
+            if column == 1:
+                return self._env_vars[row].value
+            return None
+        if role == Qt.ItemDataRole.ToolTipRole and column == 1:
+            return self._env_vars[row].value
+        if role == Qt.ItemDataRole.BackgroundRole and column == 2:
+            if self._env_vars[row].env_type == EnvType.SYSTEM:
+                return QColor(Qt.GlobalColor.lightGray)
+            return None
+        if role == Qt.ItemDataRole.ForegroundRole and column == 3:
+            return QColor(self._get_status_color(self._env_vars[row]))
+        return None
+        
+    def set_env_vars(self, env_vars: List[EnvironmentVariable]):
+        """设置环境变量列表（整体重置模型）"""
+        self.beginResetModel()
+        self._env_vars = env_vars
+        self._rows = [self._make_row(env_var) for env_var in env_vars]
+        self.endResetModel()
+        
+    def get_env_vars(self) -> List[EnvironmentVariable]:
+        """获取环境变量列表"""
+        return self._env_vars
+        
+    def env_var_at(self, row: int) -> Optional[EnvironmentVariable]:
+        """获取指定行的环境变量"""
+        if 0 <= row < len(self._env_vars):
+            return self._env_vars[row]
+        return None
+        
+    def append_env_var(self, env_var: EnvironmentVariable):
+        """在末尾追加环境变量"""
+        row = len(self._env_vars)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._env_vars.append(env_var)
+        self._rows.append(self._make_row(env_var))
+        self.endInsertRows()
+        
+    def set_row_env_var(self, row: int, env_var: EnvironmentVariable):
+        """替换指定行的环境变量"""
+        self._env_vars[row] = env_var
+        self._rows[row] = self._make_row(env_var)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+        
+    def remove_row(self, row: int):
+        """移除指定行的环境变量"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._env_vars[row]
+        del self._rows[row]
+        self.endRemoveRows()
+        
+    def find_row(self, name: str, env_type: EnvType) -> int:
+        """按变量名和类型查找行号，未找到返回-1"""
+        for i, var in enumerate(self._env_vars):
+            if var.name == name and var.env_type == env_type:
+                return i
+        return -1
+        
+    def _make_row(self, env_var: EnvironmentVariable) -> tuple:
+        """计算一行的显示文本"""
+        type_text = "系统" if env_var.env_type == EnvType.SYSTEM else "用户"
+        return (env_var.name, env_var.display_value, type_text, self._get_status_text(env_var))
+        
+    def _get_status_text(self, env_var: EnvironmentVariable) -> str:
+        """获取状态文本"""
+        if env_var.is_deleted:
+            return "已删除"
+        elif env_var.is_new:
+            return "新建"
+        elif env_var.is_modified:
+            return "已修改"
+        else:
+            return "正常"
+            
+    def _get_status_color(self, env_var: EnvironmentVariable):
+        """获取状态颜色"""
+        if env_var.is_deleted:
+            return Qt.GlobalColor.red
+        elif env_var.is_new:
+            return Qt.GlobalColor.green
+        elif env_var.is_modified:
+            return Qt.GlobalColor.blue
+        else:
+            return Qt.GlobalColor.black
+
+
+class EnvFilterProxyModel(QSortFilterProxyModel):
+    """环境变量排序和过滤代理模型"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._env_type_filter: Optional[EnvType] = None
+        self._status_filter = "全部"
+        self._has_attr_filter = False  # 是否启用了类型或状态过滤
+        
+        # 搜索使用同一个正则对象，只更新模式，匹配在C++中完成
+        self._search_regex = QRegularExpression()
+        self.setFilterRole(EnvTableModel.FILTER_ROLE)
+        self.setFilterKeyColumn(-1)
+        
+    def set_search(self, text: str, options: Dict[str, Any]):
+        """设置搜索条件"""
+        if not text:
+            pattern = ""
+        else:
+            pattern = text if options.get('regex', False) else QRegularExpression.escape(text)
+            if options.get('whole_word', False):
+                pattern = rf"\b(?:{pattern})\b"
+        
+        self._search_regex.setPattern(pattern)
+        if options.get('case_sensitive', False):
+            self._search_regex.setPatternOptions(QRegularExpression.PatternOption.NoPatternOption)
+        else:
+            self._search_regex.setPatternOptions(QRegularExpression.PatternOption.CaseInsensitiveOption)
+        
+        # 只搜索变量名或变量值时限定列，否则在两列中查找
+        search_name = options.get('search_name', True)
+        search_value = options.get('search_value', True)
+        if search_name and not search_value:
+            key_column = 0
+        elif search_value and not search_name:
+            key_column = 1
+        else:
+            key_column = -1
+        if key_column != self.filterKeyColumn():
+            self.setFilterKeyColumn(key_column)
+        
+        self.setFilterRegularExpression(self._search_regex)
+        
+    def set_filters(self, env_type_filter: Optional[EnvType], status_filter: str):
+        """设置类型和状态过滤条件"""
+        self._env_type_filter = env_type_filter
+        self._status_filter = status_filter
+        self._has_attr_filter = env_type_filter is not None or status_filter != "全部"
+        self.invalidateFilter()
+        
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        # 未启用类型和状态过滤时只做搜索匹配，省去逐行取变量对象
+        if not self._has_attr_filter:
+            return super().filterAcceptsRow(source_row, source_parent)
+        
+        env_var = self.sourceModel().env_var_at(source_row)
+        if env_var is None:
+            return False
+        
+        # 检查类型过滤
+        if self._env_type_filter is not None and env_var.env_type != self._env_type_filter:
+            return False
+        
+        # 检查状态过滤
+        status_text = self._status_filter
+        if status_text != "全部":
+            if status_text == "正常":
+                if env_var.is_modified or env_var.is_new or env_var.is_deleted:
+                    return False
+            elif status_text == "已修改":
+                if not env_var.is_modified:
+                    return False
+            elif status_text == "新建":
+                if not env_var.is_new:
+                    return False
+            elif status_text == "已删除":
+                if not env_var.is_deleted:
+                    return False
+        
+        return super().filterAcceptsRow(source_row, source_parent)
+
+
+class EnvTableWidget(QTableView):
+    """自定义表格控件，支持排序和过滤"""
     
     # 信号定义
     item_double_clicked = Signal(EnvironmentVariable)
@@ -30,162 +243,134 @@ class EnvTableWidget(QTableWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = get_logger(__name__)
-        self._env_vars: List[EnvironmentVariable] = []
+        self.env_model = EnvTableModel(self)
+        self.proxy_model = EnvFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.env_model)
+        self.setModel(self.proxy_model)
         self._setup_ui()
         self._setup_signals()
         
     def _setup_ui(self):
         """设置UI"""
-        # 设置列数和列标题
-        self.setColumnCount(4)
-        headers = ["变量名", "变量值", "类型", "状态"]
-        self.setHorizontalHeaderLabels(headers)
-        
-        # 设置表格属性
-        self.setAlternatingRowColors(True)
+        # 设置表格属性（交替行颜色在首次填充数据后再开启）
         self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.setSortingEnabled(True)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         
-        # 设置拖拽
-        self.setDragEnabled(True)
-        self.setAcceptDrops(True)
-        self.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
-        
         # 设置列宽
         header = self.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # 变量名
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)  # 变量名
+        header.resizeSection(0, 200)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # 变量值
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # 类型
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # 状态
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)  # 类型
+        header.resizeSection(2, 70)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Interactive)  # 状态
+        header.resizeSection(3, 80)
         
-        # 设置垂直表头
-        self.verticalHeader().setVisible(False)
+        # 设置垂直表头，固定行高避免按内容逐行计算
+        vertical_header = self.verticalHeader()
+        vertical_header.setVisible(False)
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(self.fontMetrics().height() + 8)
         
     def _setup_signals(self):
         """设置信号连接"""
-        self.itemDoubleClicked.connect(self._on_item_double_clicked)
-        self.itemSelectionChanged.connect(self._on_selection_changed)
+        self.doubleClicked.connect(self._on_item_double_clicked)
+        self.selectionModel().selectionChanged.connect(self._on_selection_changed)
         self.customContextMenuRequested.connect(self._on_context_menu_requested)
         
     def set_env_vars(self, env_vars: List[EnvironmentVariable]):
         """设置环境变量列表"""
-        self._env_vars = env_vars
-        self._refresh_table()
+        # 重置期间暂停重绘并屏蔽选择信号，数据就绪后统一刷新一次
+        had_selection = self.selectionModel().hasSelection()
+        self.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(self.selectionModel()):
+                self.env_model.set_env_vars(env_vars)
+            if not self.alternatingRowColors():
+                self.setAlternatingRowColors(True)
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        # 重置会清空选择，只在之前有选中项时通知一次
+        if had_selection:
+            self._on_selection_changed()
         
     def get_env_vars(self) -> List[EnvironmentVariable]:
         """获取环境变量列表"""
-        return self._env_vars
+        return self.env_model.get_env_vars()
         
     def get_selected_env_vars(self) -> List[EnvironmentVariable]:
         """获取选中的环境变量"""
-        selected_vars = []
-        for row in self._get_selected_rows():
-            if row < len(self._env_vars):
-                selected_vars.append(self._env_vars[row])
-        return selected_vars
+        env_vars = self.env_model.get_env_vars()
+        return [env_vars[row] for row in self._get_selected_rows()]
         
     def _get_selected_rows(self) -> List[int]:
-        """获取选中的行号列表"""
-        selected_rows = set()
-        for item in self.selectedItems():
-            selected_rows.add(item.row())
-        return sorted(list(selected_rows))
+        """获取选中的行号列表（源模型行号）"""
+        map_to_source = self.proxy_model.mapToSource
+        rows = {map_to_source(index).row() for index in self.selectionModel().selectedRows()}
+        return sorted(rows)
         
-    def _refresh_table(self):
-        """刷新表格显示"""
-        self.setRowCount(len(self._env_vars))
+    def selected_count(self) -> int:
+        """获取选中的行数"""
+        return len(self.selectionModel().selectedRows())
         
-        for row, env_var in enumerate(self._env_vars):
-            self._set_row_data(row, env_var)
-            
-    def _set_row_data(self, row: int, env_var: EnvironmentVariable):
-        """设置行数据"""
-        # 变量名
-        name_item = QTableWidgetItem(env_var.name)
-        name_item.setData(Qt.ItemDataRole.UserRole, env_var)
-        self.setItem(row, 0, name_item)
-        
-        # 变量值
-        value_item = QTableWidgetItem(env_var.display_value)
-        value_item.setToolTip(env_var.value)
-        self.setItem(row, 1, value_item)
-        
-        # 类型
-        type_text = "系统" if env_var.env_type == EnvType.SYSTEM else "用户"
-        type_item = QTableWidgetItem(type_text)
-        if env_var.env_type == EnvType.SYSTEM:
-            type_item.setBackground(Qt.GlobalColor.lightGray)
-        self.setItem(row, 2, type_item)
+    def set_filters(self, env_type_filter: Optional[EnvType], status_filter: str):
+        """设置类型和状态过滤条件"""
+        self.proxy_model.set_filters(env_type_filter, status_filter)
         
-        # 状态
-        status_text = self._get_status_text(env_var)
-        status_item = QTableWidgetItem(status_text)
-        status_item.setForeground(self._get_status_color(env_var))
-        self.setItem(row, 3, status_item)
+    def set_search(self, text: str, options: Dict[str, Any]):
+        """设置搜索条件"""
+        self.proxy_model.set_search(text, options)
         
-    def _get_status_text(self, env_var: EnvironmentVariable) -> str:
-        """获取状态文本"""
-        if env_var.is_deleted:
-            return "已删除"
-        elif env_var.is_new:
-            return "新建"
-        elif env_var.is_modified:
-            return "已修改"
-        else:
-            return "正常"
-            
-    def _get_status_color(self, env_var: EnvironmentVariable):
-        """获取状态颜色"""
-        if env_var.is_deleted:
-            return Qt.GlobalColor.red
-        elif env_var.is_new:
-            return Qt.GlobalColor.green
-        elif env_var.is_modified:
-            return Qt.GlobalColor.blue
-        else:
-            return Qt.GlobalColor.black
+    def visible_count(self) -> int:
+        """获取过滤后可见的行数"""
+        return self.proxy_model.rowCount()
+        
+    def _refresh_table(self):
+        """刷新表格显示"""
+        self.env_model.set_env_vars(self.env_model.get_env_vars())
             
-    def _on_item_double_clicked(self, item: QTableWidgetItem):
+    def _on_item_double_clicked(self, index: QModelIndex):
         """处理双击事件"""
-        env_var = item.data(Qt.ItemDataRole.UserRole)
+        env_var = index.data(Qt.ItemDataRole.UserRole)
         if env_var:
             self.item_double_clicked.emit(env_var)
             
-    def _on_selection_changed(self):
+    def _on_selection_changed(self, selected=None, deselected=None):
         """处理选择变化事件"""
         selected_vars = self.get_selected_env_vars()
         self.selection_changed.emit(selected_vars)
         
     def _on_context_menu_requested(self, position):
         """处理右键菜单请求"""
-        item = self.itemAt(position)
-        if not item:
+        index = self.indexAt(position)
+        if not index.isValid():
             return
             
-        env_var = item.data(Qt.ItemDataRole.UserRole)
+        env_var = index.data(Qt.ItemDataRole.UserRole)
         if env_var:
-            self.context_menu_requested.emit(env_var, self.mapToGlobal(position))
+            self.context_menu_requested.emit(env_var, self.viewport().mapToGlobal(position))
     
     def add_env_var(self, env_var: EnvironmentVariable):
         """添加环境变量"""
-        self._env_vars.append(env_var)
-        self._refresh_table()
+        self.env_model.append_env_var(env_var)
         
     def update_env_var(self, env_var: EnvironmentVariable):
-        """更新环境变量"""
-        for i, var in enumerate(self._env_vars):
-            if var.name == env_var.name and var.env_type == env_var.env_type:
-                self._env_vars[i] = env_var
-                self._set_row_data(i, env_var)
-                break
+        """更新环境变量，表格中不存在时追加"""
+        row = self.env_model.find_row(env_var.name, env_var.env_type)
+        if row >= 0:
+            self.env_model.set_row_env_var(row, env_var)
+        else:
+            self.env_model.append_env_var(env_var)
                 
     def remove_env_var(self, env_var: EnvironmentVariable):
         """移除环境变量"""
-        self._env_vars = [var for var in self._env_vars 
-                         if not (var.name == env_var.name and var.env_type == env_var.env_type)]
-        self._refresh_table()
+        row = self.env_model.find_row(env_var.name, env_var.env_type)
+        if row >= 0:
+            self.env_model.remove_row(row)
 
 
 class EnvTable(QWidget):
@@ -215,12 +400,17 @@ class EnvTable(QWidget):
         # 类型过滤
         self.type_filter = QComboBox()
         self.type_filter.addItems(["全部", "系统变量", "用户变量"])
+        # 按已知的最长文本确定宽度，避免逐项测量
+        self.type_filter.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon)
+        self.type_filter.setMinimumContentsLength(6)
         toolbar_layout.addWidget(QLabel("类型:"))
         toolbar_layout.addWidget(self.type_filter)
         
         # 状态过滤
         self.status_filter = QComboBox()
         self.status_filter.addItems(["全部", "正常", "已修改", "新建", "已删除"])
+        self.status_filter.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon)
+        self.status_filter.setMinimumContentsLength(6)
         toolbar_layout.addWidget(QLabel("状态:"))
         toolbar_layout.addWidget(self.status_filter)
         
@@ -251,7 +441,7 @@ class EnvTable(QWidget):
         
         # 编辑
         edit_action = QAction("编辑", self)
-        edit_action.setShortcut(SHORTCUTS['EDIT'])
+        edit_action.setShortcut(KEY_SEQUENCES['EDIT'])
         edit_action.triggered.connect(self._edit_selected)
         self.context_menu.addAction(edit_action)
         
@@ -271,7 +461,7 @@ class EnvTable(QWidget):
         
         # 删除
         delete_action = QAction("删除", self)
-        delete_action.setShortcut(SHORTCUTS['DELETE'])
+        delete_action.setShortcut(KEY_SEQUENCES['DELETE'])
         delete_action.triggered.connect(self._delete_selected)
         self.context_menu.addAction(delete_action)
         
@@ -355,28 +545,8 @@ class EnvTable(QWidget):
         # 状态过滤
         status_text = self.status_filter.currentText()
         
-        # 应用过滤
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item:
-                env_var = item.data(Qt.ItemDataRole.UserRole)
-                
-                # 检查类型过滤
-                type_match = env_type_filter is None or env_var.env_type == env_type_filter
-                
-                # 检查状态过滤
-                status_match = True
-                if status_text != "全部":
-                    if status_text == "正常":
-                        status_match = not (env_var.is_modified or env_var.is_new or env_var.is_deleted)
-                    elif status_text == "已修改":
-                        status_match = env_var.is_modified
-                    elif status_text == "新建":
-                        status_match = env_var.is_new
-                    elif status_text == "已删除":
-                        status_match = env_var.is_deleted
-                
-                self.table.setRowHidden(row, not (type_match and status_match))
+        # 应用过滤（由代理模型完成）
+        self.table.set_filters(env_type_filter, status_text)
                 
     def set_env_vars(self, env_vars: List[EnvironmentVariable]):
         """设置环境变量列表"""
@@ -391,6 +561,14 @@ class EnvTable(QWidget):
         """获取选中的环境变量"""
         return self.table.get_selected_env_vars()
         
+    def set_search(self, text: str, options: Dict[str, Any]):
+        """设置搜索条件"""
+        self.table.set_search(text, options)
+        
+    def visible_count(self) -> int:
+        """获取过滤后可见的变量数"""
+        return self.table.visible_count()
+        
     def add_env_var(self, env_var: EnvironmentVariable):
         """添加环境变量"""
         self.table.add_env_var(env_var)
@@ -399,6 +577,7 @@ class EnvTable(QWidget):
     def update_env_var(self, env_var: EnvironmentVariable):
         """更新环境变量"""
         self.table.update_env_var(env_var)
+        self._update_stats()
         
     def remove_env_var(self, env_var: EnvironmentVariable):
         """移除环境变量"""
@@ -413,7 +592,7 @@ class EnvTable(QWidget):
     def _update_stats(self):
         """更新统计信息"""
         total = len(self.table.get_env_vars())
-        selected = len(self.table.get_selected_env_vars())
+        selected = self.table.selected_count()
         
         if selected == 0:
             self.stats_label.setText(f"总计: {total} 个变量")
@@ -430,8 +430,9 @@ class PathEditor(QWidget):
     
     def _update_buttons_state(self):
         """更新按钮状态"""
-        has_selection = bool(self.path_list.selectedItems())
-        self.edit_btn.setEnabled(has_selection and len(self.path_list.selectedItems()) == 1)
+        selected_count = len(self.path_list.selectedItems())
+        has_selection = selected_count > 0
+        self.edit_btn.setEnabled(selected_count == 1)
         self.remove_btn.setEnabled(has_selection)
     
     def _on_paths_reordered(self, path_infos: List[PathInfo]):
@@ -5,7 +5,8 @@
 """
 
 import re
-from typing import List, Dict, Optional, Any
+from functools import lru_cache
+from typing import List, Dict, Optional, Any, Tuple, Pattern
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox, 
     QLabel, QPushButton, QCheckBox, QCompleter, QGroupBox,
@@ -19,6 +20,15 @@ from ...utils.constants import SEARCH_TYPES
 from ...utils.logger import get_logger
 
 
+@lru_cache(maxsize=64)
+def _compile_search_pattern(pattern: str, case_sensitive: bool) -> Optional[Pattern[str]]:
+    """编译并缓存搜索用的正则表达式，无效表达式返回None"""
+    try:
+        return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+    except re.error:
+        return None
+
+
 class SearchHistoryManager:
     """搜索历史管理器"""
     
@@ -89,6 +99,9 @@ class AdvancedSearchDialog(QDialog):
         type_layout.addWidget(QLabel("搜索范围:"))
         self.search_type = QComboBox()
         self.search_type.addItems(["变量名", "变量值", "全部"])
+        # 按已知的最长文本确定宽度，避免逐项测量
+        self.search_type.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon)
+        self.search_type.setMinimumContentsLength(6)
         type_layout.addWidget(self.search_type)
         conditions_layout.addLayout(type_layout)
         
@@ -97,6 +110,8 @@ class AdvancedSearchDialog(QDialog):
         env_type_layout.addWidget(QLabel("变量类型:"))
         self.env_type = QComboBox()
         self.env_type.addItems(["全部", "系统变量", "用户变量"])
+        self.env_type.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon)
+        self.env_type.setMinimumContentsLength(6)
         env_type_layout.addWidget(self.env_type)
         conditions_layout.addLayout(env_type_layout)
         
@@ -160,6 +175,12 @@ class SearchWidget(QWidget):
     search_cleared = Signal()  # 搜索清除
     textChanged = Signal(str)  # 搜索文本实时变化（便捷信号）
     
+    # 历史记录菜单中显示的最大条数
+    _MAX_HISTORY_ACTIONS = 10
+    
+    # 快速过滤按钮数量（全部/系统/用户/已修改）
+    _NUM_QUICK_FILTERS = 4
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = get_logger(__name__)
@@ -168,7 +189,20 @@ class SearchWidget(QWidget):
         self.search_timer.setSingleShot(True)
         self.search_timer.timeout.connect(self._perform_search)
         
-        self._current_search_options = {}
+        # 结果统计标签延迟更新，合并短时间内的多次计数变化
+        self._pending_counts: Optional[Tuple[int, int]] = None
+        self._label_timer = QTimer(self)
+        self._label_timer.setSingleShot(True)
+        self._label_timer.setInterval(30)
+        self._label_timer.timeout.connect(self._apply_result_count)
+        
+        # 上一次发射的搜索条件，用于跳过重复搜索
+        self._last_emit: Optional[Tuple[str, Tuple]] = None
+        
+        # 普通查询的预处理缓存（同一次过滤中各行共享）: (查询文本, 区分大小写) -> (处理后的查询, 关键词)
+        self._terms_query: Optional[Tuple[str, bool]] = None
+        self._query_terms: Tuple[str, Tuple[str, ...]] = ("", ())
+        
         self._setup_ui()
         self._setup_signals()
         self._load_settings()
@@ -190,6 +224,8 @@ class SearchWidget(QWidget):
         self.completer = QCompleter()
         self.completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        self._completer_model = QStringListModel(self)
+        self.completer.setModel(self._completer_model)
         self.search_input.setCompleter(self.completer)
         self._update_completer()
         
@@ -280,6 +316,20 @@ class SearchWidget(QWidget):
         # 历史记录
         history_menu = menu.addMenu("搜索历史")
         self.history_menu = history_menu
+        
+        # 预先创建历史记录动作池，更新时只修改文本和数据
+        self._no_history_action = QAction("无历史记录", self)
+        self._no_history_action.setEnabled(False)
+        history_menu.addAction(self._no_history_action)
+        
+        self._history_actions: List[QAction] = []
+        for _ in range(self._MAX_HISTORY_ACTIONS):
+            action = QAction(self)
+            action.setVisible(False)
+            action.triggered.connect(self._on_history_action_triggered)
+            history_menu.addAction(action)
+            self._history_actions.append(action)
+        
         self._update_history_menu()
         
         menu.addSeparator()
@@ -330,18 +380,29 @@ class SearchWidget(QWidget):
             self._update_completer()
             self._update_history_menu()
             
-        self._perform_search()
+        self._perform_search(force=True)
+        
+    def _perform_search(self, force: bool = False):
+        """执行搜索
         
-    def _perform_search(self):
-        """执行搜索"""
+        Args:
+            force: 为True时即使搜索条件与上次相同也重新发射信号
+        """
         text = self.search_input.text().strip()
         options = self._get_current_search_options()
         
         if not text:
-            self.result_label.setText("准备搜索")
+            self._last_emit = None
+            self._reset_result_label()
             self.search_cleared.emit()
-        else:
-            self.search_changed.emit(text, options)
+            return
+            
+        key = (text, tuple(sorted(options.items())))
+        if not force and key == self._last_emit:
+            return
+            
+        self._last_emit = key
+        self.search_changed.emit(text, options)
             
     def _get_current_search_options(self) -> Dict[str, Any]:
         """获取当前搜索选项"""
@@ -378,34 +439,59 @@ class SearchWidget(QWidget):
         self.advanced_dialog.exec()
         
     def _on_advanced_search(self, params: Dict[str, Any]):
-        """处理高级搜索"""
-        self._current_search_options.update(params)
-        text = self.search_input.text().strip()
-        if text:
-            self.search_changed.emit(text, self._current_search_options)
+        """处理高级搜索
+        
+        高级搜索的条件（search_type、regex_search等）先同步到搜索选项菜单，
+        再按统一的选项名（search_name、search_value、regex等）执行搜索。
+        """
+        search_type = params.get('search_type', '全部')
+        option_states = (
+            (self.search_name_action, search_type in ('变量名', '全部')),
+            (self.search_value_action, search_type in ('变量值', '全部')),
+            (self.case_sensitive_action, params.get('case_sensitive', False)),
+            (self.whole_word_action, params.get('whole_word', False)),
+            (self.regex_action, params.get('regex_search', False)),
+        )
+        for action, checked in option_states:
+            action.blockSignals(True)
+            action.setChecked(checked)
+            action.blockSignals(False)
+        
+        if self.search_input.text().strip():
+            self._perform_search(force=True)
         else:
             self.filter_changed.emit(params)
         
     def _update_completer(self):
         """更新自动完成"""
-        model = QStringListModel(self.history_manager.get_history())
-        self.completer.setModel(model)
+        # 弹出框可见时推迟到下一次事件循环，避免输入过程中重置补全模型
+        if self.completer.popup().isVisible():
+            QTimer.singleShot(0, self._apply_completer_history)
+        else:
+            self._apply_completer_history()
+            
+    def _apply_completer_history(self):
+        """将搜索历史写入自动完成模型"""
+        self._completer_model.setStringList(self.history_manager.get_history())
         
     def _update_history_menu(self):
         """更新历史记录菜单"""
-        self.history_menu.clear()
-        
-        history = self.history_manager.get_history()
-        if not history:
-            action = QAction("无历史记录", self)
-            action.setEnabled(False)
-            self.history_menu.addAction(action)
-            return
-            
-        for query in history[:10]:  # 只显示最近10条
-            action = QAction(query, self)
-            action.triggered.connect(lambda checked, q=query: self._use_history_query(q))
-            self.history_menu.addAction(action)
+        history = self.history_manager.get_history()[:self._MAX_HISTORY_ACTIONS]
+        self._no_history_action.setVisible(not history)
+        
+        for i, action in enumerate(self._history_actions):
+            if i < len(history):
+                action.setText(history[i])
+                action.setData(history[i])
+                action.setVisible(True)
+            else:
+                action.setVisible(False)
+                
+    def _on_history_action_triggered(self):
+        """处理历史记录菜单项点击"""
+        action = self.sender()
+        if isinstance(action, QAction):
+            self._use_history_query(action.data())
             
     def _use_history_query(self, query: str):
         """使用历史搜索查询"""
@@ -436,8 +522,10 @@ class SearchWidget(QWidget):
             
         # 快速过滤
         filter_id = settings.value("search/quick_filter", 0, int)
-        if 0 <= filter_id < self.quick_filter_group.buttons().__len__():
-            self.quick_filter_group.button(filter_id).setChecked(True)
+        if 0 <= filter_id < self._NUM_QUICK_FILTERS:
+            button = self.quick_filter_group.button(filter_id)
+            if button:
+                button.setChecked(True)
             
     def _save_settings(self):
         """保存设置"""
@@ -465,19 +553,40 @@ class SearchWidget(QWidget):
     def clear_search(self):
         """清除搜索"""
         self.search_input.clear()
-        self.result_label.setText("准备搜索")
+        self._last_emit = None
+        self._reset_result_label()
         self.search_cleared.emit()
     
     def clear(self):
         """清除搜索（便捷方法）"""
         self.clear_search()
         
+    def _reset_result_label(self):
+        """重置结果统计标签，丢弃未应用的计数"""
+        self._label_timer.stop()
+        self._pending_counts = None
+        self.result_label.setText("准备搜索")
+        
     def set_result_count(self, total: int, filtered: int):
-        """设置搜索结果数量"""
+        """设置搜索结果数量（延迟合并更新）"""
+        self._pending_counts = (total, filtered)
+        self._label_timer.start()
+        
+    def _apply_result_count(self):
+        """将待更新的结果数量写入标签"""
+        if self._pending_counts is None:
+            return
+            
+        total, filtered = self._pending_counts
+        self._pending_counts = None
+        
         if total == filtered:
-            self.result_label.setText(f"显示 {total} 个变量")
+            text = f"显示 {total} 个变量"
         else:
-            self.result_label.setText(f"找到 {filtered} 个变量 (共 {total} 个)")
+            text = f"找到 {filtered} 个变量 (共 {total} 个)"
+            
+        if text != self.result_label.text():
+            self.result_label.setText(text)
             
     def get_search_options(self) -> Dict[str, Any]:
         """获取搜索选项"""
@@ -488,32 +597,35 @@ class SearchWidget(QWidget):
         if not search_query:
             return True
             
-        # 准备搜索文本
-        search_text = text
-        query = search_query
+        case_sensitive = options.get('case_sensitive', False)
         
-        if not options.get('case_sensitive', False):
-            search_text = search_text.lower()
-            query = query.lower()
-            
-        # 正则表达式搜索
+        # 正则表达式搜索（大小写由编译标志处理，不转换文本）
         if options.get('regex', False):
-            try:
-                flags = 0 if options.get('case_sensitive', False) else re.IGNORECASE
-                return bool(re.search(query, search_text, flags))
-            except re.error:
-                return False
+            pattern = _compile_search_pattern(search_query, case_sensitive)
+            return pattern is not None and pattern.search(text) is not None
                 
         # 全字匹配
         if options.get('whole_word', False):
-            import re
-            pattern = r'\b' + re.escape(query) + r'\b'
-            flags = 0 if options.get('case_sensitive', False) else re.IGNORECASE
-            return bool(re.search(pattern, search_text, flags))
+            pattern = _compile_search_pattern(
+                r'\b' + re.escape(search_query) + r'\b', case_sensitive)
+            return pattern is not None and pattern.search(text) is not None
             
-        # 普通搜索
+        # 普通搜索（多个关键词时要求全部命中），查询只转换一次，每行只转换被检查的文本
+        query, terms = self._get_query_terms(search_query, case_sensitive)
+        search_text = text if case_sensitive else text.lower()
+        if len(terms) > 1:
+            return all(term in search_text for term in terms)
         return query in search_text
         
+    def _get_query_terms(self, query: str, case_sensitive: bool) -> Tuple[str, Tuple[str, ...]]:
+        """获取处理后的查询文本和关键词（按查询缓存，避免逐行重复转换和分词）"""
+        key = (query, case_sensitive)
+        if key != self._terms_query:
+            prepared = query if case_sensitive else query.lower()
+            self._terms_query = key
+            self._query_terms = (prepared, tuple(dict.fromkeys(prepared.split())))
+        return self._query_terms
+        
     def closeEvent(self, event):
         """关闭事件处理"""
         self._save_settings()
@@ -4,22 +4,49 @@
 提供新建和编辑环境变量的界面。
 """
 
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Tuple
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QGridLayout,
-    QLabel, QLineEdit, QTextEdit, QComboBox, QPushButton, QGroupBox,
+    QLabel, QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QPushButton, QGroupBox,
     QCheckBox, QSplitter, QScrollArea, QFrame, QMessageBox,
     QApplication, QWidget, QTabWidget
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont, QTextCharFormat, QSyntaxHighlighter, QTextDocument
+from PySide6.QtCore import Qt, Signal, QTimer, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import QFont, QTextCharFormat, QSyntaxHighlighter, QTextDocument, QTextCursor
 
 from ...models.env_model import EnvironmentVariable, EnvType
 from ...core.validator import Validator
-from ...utils.helpers import is_valid_var_name, split_path_value, join_path_value, validate_path
+from ...utils.helpers import (
+    is_valid_var_name, split_path_value, join_path_value, batch_path_exists,
+    validate_path, invalidate_path_cache
+)
 from ...utils.constants import MAX_PATH_LENGTH, MAX_SINGLE_PATH_LENGTH, PATH_SEPARATOR
 
 
+class PathScanSignals(QObject):
+    """PATH扫描任务信号"""
+    finished = Signal(int, object)  # 任务代号, [(路径, 是否有效, 是否存在)]
+
+
+class PathScanJob(QRunnable):
+    """在线程池中扫描PATH路径有效性和存在性的任务"""
+    
+    def __init__(self, generation: int, paths: List[str]):
+        super().__init__()
+        self.generation = generation
+        self.paths = list(paths)
+        self.signals = PathScanSignals()
+    
+    def run(self):
+        exists_flags = batch_path_exists(self.paths)
+        results = [
+            (path, validate_path(path), exists)
+            for path, exists in zip(self.paths, exists_flags)
+        ]
+        self.signals.finished.emit(self.generation, results)
+
+
 class PathHighlighter(QSyntaxHighlighter):
     """PATH变量语法高亮器"""
     
@@ -36,28 +63,67 @@ class PathHighlighter(QSyntaxHighlighter):
         self.separator_format = QTextCharFormat()
         self.separator_format.setForeground(Qt.GlobalColor.blue)
         self.separator_format.setBackground(Qt.GlobalColor.lightGray)
+        
+        # 按块号缓存已计算的格式区间: 块号 -> (修订号, 文本, [(起点, 长度, 格式)])
+        self._block_cache: Dict[int, Tuple[int, str, List[Tuple[int, int, QTextCharFormat]]]] = {}
+    
+    def clear_cache(self):
+        """清除路径验证缓存"""
+        invalidate_path_cache()
+        self._block_cache.clear()
     
     def highlightBlock(self, text: str):
         """高亮PATH变量"""
         if not text:
             return
         
-        paths = text.split(PATH_SEPARATOR)
-        position = 0
+        # 只有空白和分隔符的块无需验证路径，只标记分隔符
+        if not text.replace(PATH_SEPARATOR, '').strip():
+            for i, ch in enumerate(text):
+                if ch == PATH_SEPARATOR:
+                    self.setFormat(i, 1, self.separator_format)
+            return
+        
+        # 块内容未变化时直接重放缓存的格式，跳过路径验证
+        block = self.currentBlock()
+        block_number = block.blockNumber()
+        revision = block.revision()
+        set_format = self.setFormat
+        cached = self._block_cache.get(block_number)
+        if cached is not None and cached[0] == revision and cached[1] == text:
+            for start, length, fmt in cached[2]:
+                set_format(start, length, fmt)
+            return
         
-        for i, path in enumerate(paths):
-            if i > 0:  # 不是第一个路径，需要处理前面的分隔符
-                separator_start = position - 1
-                self.setFormat(separator_start, 1, self.separator_format)
+        # 循环内使用局部变量，减少属性查找
+        valid_format = self.valid_format
+        invalid_format = self.invalid_format
+        separator_format = self.separator_format
+        spans = []
+        add_span = spans.append
+        find = text.find
+        
+        # 按分隔符位置逐段扫描，直接使用原文本中的下标
+        start = 0
+        length = len(text)
+        while start <= length:
+            end = find(PATH_SEPARATOR, start)
+            if end < 0:
+                end = length
             
-            if path.strip():
+            stripped = text[start:end].strip()
+            if stripped:
                 # 验证路径有效性
-                if validate_path(path.strip()):
-                    self.setFormat(position, len(path), self.valid_format)
-                else:
-                    self.setFormat(position, len(path), self.invalid_format)
+                fmt = valid_format if validate_path(stripped) else invalid_format
+                add_span((start, end - start, fmt))
             
-            position += len(path) + 1  # +1 for separator
+            if end < length:
+                add_span((end, 1, separator_format))
+            start = end + 1
+        
+        for start, length, fmt in spans:
+            set_format(start, length, fmt)
+        self._block_cache[block_number] = (revision, text, spans)
 
 
 class EditDialog(QDialog):
@@ -66,6 +132,13 @@ class EditDialog(QDialog):
     # 信号定义
     variable_saved = Signal(EnvironmentVariable)  # 变量保存成功信号
     
+    # 同步逐块重新高亮的最大块数，超过则延迟到下一次事件循环整体重新高亮
+    _MAX_SYNC_REHIGHLIGHT_BLOCKS = 20
+    
+    # PATH内容超过此长度时停用语法高亮，降到恢复阈值以下再启用（防止反复切换）
+    _HIGHLIGHT_DISABLE_LENGTH = 64000
+    _HIGHLIGHT_ENABLE_LENGTH = 48000
+    
     def __init__(self, parent=None, variable: Optional[EnvironmentVariable] = None):
         """
         初始化对话框
@@ -83,6 +156,22 @@ class EditDialog(QDialog):
         self.validation_timer = QTimer()
         self.validation_timer.setSingleShot(True)
         self.validation_timer.timeout.connect(self._validate_input)
+        self.preview_timer = QTimer()
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.timeout.connect(self._update_preview)
+        self._preview_dirty = True
+        self._last_preview_header = ""
+        self._preview_body_lines: List[str] = []
+        
+        # 上一次验证的输入及结果: ((变量名, 变量值, 类型), (状态, 消息))
+        self._last_validated: Optional[Tuple[tuple, Tuple[str, str]]] = None
+        
+        # 后台路径扫描，代号用于丢弃过期结果
+        self._scan_generation = 0
+        self._scan_job: Optional[PathScanJob] = None
+        
+        # 最近一次PATH分割结果缓存: (原始值, 路径列表)
+        self._split_cache: Optional[Tuple[str, List[str]]] = None
         
         # 设置对话框属性
         self.setWindowTitle("编辑环境变量" if self.is_edit_mode else "新建环境变量")
@@ -114,13 +203,10 @@ class EditDialog(QDialog):
         basic_tab = self._create_basic_tab()
         self.tab_widget.addTab(basic_tab, "基本信息")
         
-        # 高级设置标签页
-        advanced_tab = self._create_advanced_tab()
-        self.tab_widget.addTab(advanced_tab, "高级设置")
-        
-        # 预览标签页
-        preview_tab = self._create_preview_tab()
-        self.tab_widget.addTab(preview_tab, "预览")
+        # 高级设置和预览标签页先使用占位部件，首次切换到时再创建
+        self._built_tabs = set()
+        self.tab_widget.addTab(QWidget(), "高级设置")
+        self.tab_widget.addTab(QWidget(), "预览")
         
         # 验证状态显示
         self.validation_frame = self._create_validation_frame()
@@ -189,6 +275,12 @@ class EditDialog(QDialog):
         
         # 为PATH编辑器添加语法高亮
         self.path_highlighter = PathHighlighter(self.path_value_edit.document())
+        self._highlight_enabled = True
+        
+        # 内容过大时的高亮停用提示
+        self.highlight_disabled_label = QLabel("语法高亮已禁用（内容过大）")
+        self.highlight_disabled_label.setStyleSheet("color: gray;")
+        self.highlight_disabled_label.hide()
         
         value_layout.addWidget(QLabel("简单值:"))
         value_layout.addWidget(self.simple_value_edit)
@@ -196,6 +288,7 @@ class EditDialog(QDialog):
         value_layout.addWidget(self.multi_value_edit)
         value_layout.addWidget(QLabel("PATH值:"))
         value_layout.addWidget(self.path_value_edit)
+        value_layout.addWidget(self.highlight_disabled_label)
         
         layout.addWidget(value_group)
         
@@ -217,7 +310,7 @@ class EditDialog(QDialog):
         path_tools_layout = QVBoxLayout(self.path_tools_group)
         
         # PATH路径列表显示
-        self.path_list_edit = QTextEdit()
+        self.path_list_edit = QPlainTextEdit()
         self.path_list_edit.setReadOnly(True)
         self.path_list_edit.setMaximumHeight(200)
         path_tools_layout.addWidget(QLabel("路径列表:"))
@@ -273,11 +366,20 @@ class EditDialog(QDialog):
         preview_group = QGroupBox("变量预览")
         preview_layout = QVBoxLayout(preview_group)
         
-        # 预览文本
-        self.preview_text = QTextEdit()
+        # 预览头部（变量名、类型等概要信息）
+        self.preview_header_label = QLabel()
+        self.preview_header_label.setTextFormat(Qt.TextFormat.PlainText)
+        self.preview_header_label.setFont(QFont("Consolas", 10))
+        self.preview_header_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        
+        # 预览文本（PATH路径列表或变量值）
+        self.preview_text = QPlainTextEdit()
         self.preview_text.setReadOnly(True)
         self.preview_text.setFont(QFont("Consolas", 10))
+        # 预览内容由程序增量改写，不需要撤销记录
+        self.preview_text.setUndoRedoEnabled(False)
         
+        preview_layout.addWidget(self.preview_header_label)
         preview_layout.addWidget(self.preview_text)
         layout.addWidget(preview_group)
         
@@ -350,7 +452,9 @@ class EditDialog(QDialog):
     def _setup_connections(self):
         """设置信号连接"""
         # 输入变化监听
-        self.name_edit.textChanged.connect(self._on_input_changed)
+        # 变量名逐字输入只做轻量处理，编辑完成后再刷新预览
+        self.name_edit.textChanged.connect(self._on_name_changed)
+        self.name_edit.editingFinished.connect(self._on_input_changed)
         self.simple_value_edit.textChanged.connect(self._on_input_changed)
         self.multi_value_edit.textChanged.connect(self._on_input_changed)
         self.path_value_edit.textChanged.connect(self._on_input_changed)
@@ -359,11 +463,6 @@ class EditDialog(QDialog):
         # PATH类型变量切换
         self.is_path_check.toggled.connect(self._on_path_type_changed)
         
-        # PATH工具按钮
-        self.format_path_btn.clicked.connect(self._format_path_value)
-        self.remove_duplicates_btn.clicked.connect(self._remove_duplicate_paths)
-        self.validate_paths_btn.clicked.connect(self._validate_all_paths)
-        
         # 标签页切换
         self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
@@ -411,9 +510,9 @@ class EditDialog(QDialog):
         self.path_value_edit.hide()
         
         # 显示相应的编辑器
+        self.highlight_disabled_label.setVisible(is_path and not self._highlight_enabled)
         if is_path:
             self.path_value_edit.show()
-            self.path_tools_group.show()
         else:
             # 根据值的复杂性选择编辑器
             current_value = self._get_current_value()
@@ -421,7 +520,9 @@ class EditDialog(QDialog):
                 self.multi_value_edit.show()
             else:
                 self.simple_value_edit.show()
-            self.path_tools_group.hide()
+        
+        if 1 in self._built_tabs:
+            self.path_tools_group.setVisible(is_path)
     
     def _get_current_value(self) -> str:
         """获取当前输入的值"""
@@ -432,6 +533,16 @@ class EditDialog(QDialog):
         else:
             return self.simple_value_edit.text()
     
+    def _split_paths(self, value: str) -> List[str]:
+        """分割PATH值，相同值复用上一次的结果（调用方不应修改返回的列表）"""
+        cached = self._split_cache
+        if cached is not None and (cached[0] is value or cached[0] == value):
+            return cached[1]
+        
+        paths = split_path_value(value)
+        self._split_cache = (value, paths)
+        return paths
+    
     def _set_current_value(self, value: str):
         """设置当前值"""
         if self.is_path_check.isChecked():
@@ -444,54 +555,156 @@ class EditDialog(QDialog):
     def _on_input_changed(self):
         """处理输入变化"""
         # 延迟验证，避免频繁验证
+        self._last_validated = None
         self.validation_timer.start(300)
         
-        # 更新预览
-        self._update_preview()
+        self._update_highlighter_state()
+        
+        # 预览标签页可见时延迟更新，否则标记为待刷新
+        if self.tab_widget.currentIndex() == 2:
+            self.preview_timer.start(300)
+        else:
+            self._preview_dirty = True
+    
+    def _on_name_changed(self, text: str):
+        """处理变量名输入（轻量处理）"""
+        name = text.strip()
+        
+        # 只标记预览待刷新，切换到预览标签页时再重建
+        self._preview_dirty = True
+        if 2 in self._built_tabs:
+            self.name_length_label.setText(str(len(name)))
+        
+        # 名称格式明显无效时立即禁用确定按钮，完整验证仍延迟进行
+        if not is_valid_var_name(name):
+            self.ok_btn.setEnabled(False)
+        self.validation_timer.start(300)
     
     def _on_path_type_changed(self, is_path: bool):
         """处理PATH类型变化"""
+        self.path_highlighter.clear_cache()
         self._switch_value_editor(is_path)
+        if is_path:
+            self._refresh_path_highlight()
         self._validate_input()
         self._update_path_list()
+        
+        # 值的显示方式随PATH类型改变，预览需要重建
+        self._preview_dirty = True
+        self.preview_timer.start(300)
+    
+    def _update_highlighter_state(self):
+        """根据PATH内容长度挂接或分离语法高亮器"""
+        document = self.path_value_edit.document()
+        length = document.characterCount()
+        
+        if self._highlight_enabled and length > self._HIGHLIGHT_DISABLE_LENGTH:
+            self.path_highlighter.setDocument(None)
+            self._highlight_enabled = False
+        elif not self._highlight_enabled and length < self._HIGHLIGHT_ENABLE_LENGTH:
+            self.path_highlighter.setDocument(document)
+            self._highlight_enabled = True
+        else:
+            return
+        
+        self.highlight_disabled_label.setVisible(
+            not self._highlight_enabled and self.is_path_check.isChecked())
+    
+    def _refresh_path_highlight(self):
+        """按块重新高亮PATH编辑器，大文档延迟处理以便先完成界面切换"""
+        if not self._highlight_enabled:
+            return
+        
+        document = self.path_value_edit.document()
+        if document.blockCount() > self._MAX_SYNC_REHIGHLIGHT_BLOCKS:
+            QTimer.singleShot(0, self.path_highlighter.rehighlight)
+            return
+        
+        block = document.firstBlock()
+        while block.isValid():
+            self.path_highlighter.rehighlightBlock(block)
+            block = block.next()
+    
+    def _ensure_tab_built(self, index: int):
+        """首次切换到高级设置或预览标签页时创建其内容"""
+        if index in self._built_tabs or index not in (1, 2):
+            return
+        self._built_tabs.add(index)
+        
+        if index == 1:
+            widget = self._create_advanced_tab()
+            label = "高级设置"
+            
+            # PATH工具按钮
+            self.format_path_btn.clicked.connect(self._format_path_value)
+            self.remove_duplicates_btn.clicked.connect(self._remove_duplicate_paths)
+            self.validate_paths_btn.clicked.connect(self._validate_all_paths)
+            self.path_tools_group.setVisible(self.is_path_check.isChecked())
+        else:
+            widget = self._create_preview_tab()
+            label = "预览"
+        
+        # 用实际内容替换占位部件，替换过程中不触发切换信号
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, label)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
     
     def _on_tab_changed(self, index: int):
         """处理标签页切换"""
+        self._ensure_tab_built(index)
         if index == 2:  # 预览标签页
-            self._update_preview()
+            if self._preview_dirty:
+                self._update_preview()
         elif index == 1:  # 高级设置标签页
             self._update_path_list()
     
     def _validate_input(self):
-        """验证输入"""
+        """验证输入（输入未变化时直接复用上一次的结果）"""
+        # 获取输入值
+        name = self.name_edit.text().strip()
+        value = self._get_current_value()
+        env_type = self.type_combo.currentData()
+        
+        key = (name, value, env_type)
+        if self._last_validated is not None and self._last_validated[0] == key:
+            status, message = self._last_validated[1]
+        else:
+            status, message = self._check_input(name, value, env_type)
+            self._last_validated = (key, (status, message))
+        
         # 清除之前的状态
         self.validation_status_label.hide()
         self.warning_label.hide()
         self.error_label.hide()
         
-        # 获取输入值
-        name = self.name_edit.text().strip()
-        value = self._get_current_value()
-        env_type = self.type_combo.currentData()
+        # 显示状态
+        if status == "error":
+            self._show_validation_error(message)
+        elif status == "warning":
+            self._show_validation_warning(message)
+        else:
+            self._show_validation_success(message)
         
+        self.ok_btn.setEnabled(status != "error")
+    
+    def _check_input(self, name: str, value: str, env_type: EnvType) -> Tuple[str, str]:
+        """执行输入验证，返回 (状态, 消息)，状态为 error/warning/success"""
         # 验证变量名
         if not name:
-            self._show_validation_error("变量名不能为空")
-            self.ok_btn.setEnabled(False)
-            return
+            return "error", "变量名不能为空"
         
         name_valid, name_error = self.validator.validate_variable_name(name)
         if not name_valid:
-            self._show_validation_error(f"变量名错误: {name_error}")
-            self.ok_btn.setEnabled(False)
-            return
+            return "error", f"变量名错误: {name_error}"
         
         # 验证变量值
         value_valid, value_error = self.validator.validate_variable_value(value, name)
         if not value_valid:
-            self._show_validation_error(f"变量值错误: {value_error}")
-            self.ok_btn.setEnabled(False)
-            return
+            return "error", f"变量值错误: {value_error}"
         
         # 创建临时变量进行完整验证
         temp_var = EnvironmentVariable(name=name, value=value, env_type=env_type)
@@ -499,9 +712,7 @@ class EditDialog(QDialog):
         # 完整验证
         var_valid, var_error = self.validator.validate_variable(temp_var)
         if not var_valid:
-            self._show_validation_error(f"验证失败: {var_error}")
-            self.ok_btn.setEnabled(False)
-            return
+            return "error", f"验证失败: {var_error}"
         
         # 检查警告
         warnings = []
@@ -514,13 +725,9 @@ class EditDialog(QDialog):
             _, _, sys_warnings = self.validator.validate_system_variable_change(temp_var, True)
             warnings.extend(sys_warnings)
         
-        # 显示状态
         if warnings:
-            self._show_validation_warning("; ".join(warnings))
-        else:
-            self._show_validation_success("输入有效")
-        
-        self.ok_btn.setEnabled(True)
+            return "warning", "; ".join(warnings)
+        return "success", "输入有效"
     
     def _show_validation_success(self, message: str):
         """显示验证成功"""
@@ -548,42 +755,83 @@ class EditDialog(QDialog):
     
     def _update_preview(self):
         """更新预览"""
+        # 预览标签页不可见时只标记待刷新，切换到该页时再构建
+        if self.tab_widget.currentIndex() != 2:
+            self._preview_dirty = True
+            return
+        
+        self._preview_dirty = False
         name = self.name_edit.text().strip()
         value = self._get_current_value()
         env_type = self.type_combo.currentData()
-        
-        # 构建预览文本
-        preview_lines = []
-        preview_lines.append(f"变量名: {name}")
-        preview_lines.append(f"变量类型: {'系统变量' if env_type == EnvType.SYSTEM else '用户变量'}")
-        preview_lines.append(f"变量值长度: {len(value)} 字符")
-        
-        if self.is_path_check.isChecked() and value:
-            paths = split_path_value(value)
-            preview_lines.append(f"PATH路径数量: {len(paths)}")
-            preview_lines.append("")
-            preview_lines.append("PATH路径列表:")
-            for i, path in enumerate(paths, 1):
-                status = "✓" if validate_path(path) else "✗"
-                preview_lines.append(f"  {i:2d}. {status} {path}")
+        paths = self._split_paths(value) if self.is_path_check.isChecked() and value else None
+        
+        # 构建预览头部
+        header_lines = [
+            f"变量名: {name}",
+            f"变量类型: {'系统变量' if env_type == EnvType.SYSTEM else '用户变量'}",
+            f"变量值长度: {len(value)} 字符",
+        ]
+        if paths is not None:
+            header_lines.append(f"PATH路径数量: {len(paths)}")
+        
+        header_text = "\n".join(header_lines)
+        if header_text != self._last_preview_header:
+            self._last_preview_header = header_text
+            self.preview_header_label.setText(header_text)
+        
+        # 构建预览正文
+        if paths is not None:
+            body_lines = ["PATH路径列表:"]
+            body_lines.extend([
+                f"  {i:2d}. {'✓' if validate_path(path) else '✗'} {path}"
+                for i, path in enumerate(paths, 1)
+            ])
         else:
-            preview_lines.append("")
-            preview_lines.append("变量值:")
-            preview_lines.append(value)
-        
-        self.preview_text.setPlainText("\n".join(preview_lines))
+            body_lines = ["变量值:", value]
+        self._set_preview_body(body_lines)
         
         # 更新统计信息
         self.name_length_label.setText(str(len(name)))
         self.value_length_label.setText(str(len(value)))
         
-        if self.is_path_check.isChecked() and value:
-            self.path_count_label.setText(str(len(split_path_value(value))))
+        if paths is not None:
+            self.path_count_label.setText(str(len(paths)))
         else:
             self.path_count_label.setText("0")
     
+    def _set_preview_body(self, lines: List[str]):
+        """更新预览正文，行数不变时只改写发生变化的行"""
+        old_lines = self._preview_body_lines
+        if lines == old_lines:
+            return
+        
+        document = self.preview_text.document()
+        if len(lines) != len(old_lines) or document.blockCount() != len(lines):
+            self.preview_text.setPlainText("\n".join(lines))
+        else:
+            cursor = QTextCursor(document)
+            cursor.beginEditBlock()
+            for i, (old_line, new_line) in enumerate(zip(old_lines, lines)):
+                if old_line != new_line:
+                    block = document.findBlockByNumber(i)
+                    cursor.setPosition(block.position())
+                    cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock,
+                                        QTextCursor.MoveMode.KeepAnchor)
+                    cursor.insertText(new_line)
+            cursor.endEditBlock()
+        
+        self._preview_body_lines = lines
+    
     def _update_path_list(self):
-        """更新PATH路径列表"""
+        """更新PATH路径列表（在线程池中扫描，结果通过信号返回）"""
+        # 使正在进行的扫描结果失效
+        self._scan_generation += 1
+        
+        # 高级设置标签页尚未创建时无需更新，切换到该页时会重新调用
+        if 1 not in self._built_tabs:
+            return
+        
         if not self.is_path_check.isChecked():
             self.path_list_edit.clear()
             return
@@ -593,17 +841,24 @@ class EditDialog(QDialog):
             self.path_list_edit.clear()
             return
         
-        paths = split_path_value(value)
+        job = PathScanJob(self._scan_generation, self._split_paths(value))
+        job.signals.finished.connect(self._on_path_scan_finished)
+        self._scan_job = job
+        QThreadPool.globalInstance().start(job)
+    
+    def _on_path_scan_finished(self, generation: int, results: list):
+        """处理后台路径扫描结果"""
+        if generation != self._scan_generation:
+            return  # 输入已变化，丢弃过期结果
+        
+        self._scan_job = None
         path_info_lines = []
         
-        for i, path in enumerate(paths, 1):
+        for i, (path, is_valid, exists) in enumerate(results, 1):
             # 验证路径
-            is_valid = validate_path(path)
             status = "✓" if is_valid else "✗"
             
             # 检查是否存在
-            import os
-            exists = os.path.exists(path) if path else False
             exists_str = "(存在)" if exists else "(不存在)" if path else ""
             
             path_info_lines.append(f"{i:2d}. {status} {path} {exists_str}")
@@ -619,12 +874,13 @@ class EditDialog(QDialog):
         if not value:
             return
         
-        paths = split_path_value(value)
+        paths = self._split_paths(value)
         # 移除空路径
         paths = [path for path in paths if path.strip()]
         
         # 重新组合
         formatted_value = join_path_value(paths)
+        self.path_highlighter.clear_cache()
         self._set_current_value(formatted_value)
         
         self._update_path_list()
@@ -639,18 +895,17 @@ class EditDialog(QDialog):
         if not value:
             return
         
-        paths = split_path_value(value)
-        # 去重，保持顺序
-        seen = set()
-        unique_paths = []
+        paths = self._split_paths(value)
+        # 去重，保持顺序（按大小写折叠后的路径保留第一次出现）
+        seen = {}
         for path in paths:
-            path_lower = path.lower()
-            if path_lower not in seen and path.strip():
-                seen.add(path_lower)
-                unique_paths.append(path)
+            if path.strip():
+                seen.setdefault(path.casefold(), path)
+        unique_paths = list(seen.values())
         
         # 重新组合
         cleaned_value = join_path_value(unique_paths)
+        self.path_highlighter.clear_cache()
         self._set_current_value(cleaned_value)
         
         self._update_path_list()
@@ -669,15 +924,17 @@ class EditDialog(QDialog):
             QMessageBox.information(self, "验证结果", "没有路径需要验证")
             return
         
-        paths = split_path_value(value)
-        valid_count = 0
-        invalid_paths = []
+        paths = self._split_paths(value)
         
-        for path in paths:
-            if validate_path(path):
-                valid_count += 1
-            else:
-                invalid_paths.append(path)
+        # 手动验证时重新检查文件系统
+        self.path_highlighter.clear_cache()
+        
+        # 并发验证，使各路径的文件系统检查相互重叠
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(paths)))) as executor:
+            results = list(executor.map(validate_path, paths))
+        
+        valid_count = sum(results)
+        invalid_paths = [path for path, is_valid in zip(paths, results) if not is_valid]
         
         # 显示验证结果
         result_lines = [f"总路径数量: {len(paths)}"]
@@ -6,7 +6,7 @@ PATH变量专用编辑器对话框
 
 import os
 import winreg
-from typing import List, Optional
+from typing import List, Optional, Dict
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -14,46 +14,140 @@ from PySide6.QtWidgets import (
     QPushButton, QToolBar, QGroupBox, QLabel, QLineEdit, QTextEdit, 
     QProgressBar, QMessageBox, QFileDialog, QMenu, QCheckBox, QTabWidget, QWidget
 )
-from PySide6.QtCore import Qt, Signal, QThread
+from PySide6.QtCore import Qt, Signal, QThread, QTimer, QObject, QRunnable, QThreadPool
 from PySide6.QtGui import QAction, QFont, QColor
 
 from ...models.env_model import EnvType
 from ...core.path_controller import PathController  
-from ...utils.helpers import split_path_value, join_path_value, validate_path
+from ...utils.helpers import (
+    split_path_value, join_path_value, validate_path, batch_validate_paths, normalize_path
+)
+from ...utils.constants import PATH_SEPARATOR
+
 
+def _iter_path_segments(file_obj, chunk_size: int = 65536):
+    """分块读取文件并逐个产出PATH条目，避免一次性读入整个文件
+    
+    条目的处理规则与split_path_value一致。
+    """
+    pending = ""
+    while True:
+        chunk = file_obj.read(chunk_size)
+        if not chunk:
+            break
+        
+        parts = (pending + chunk).split(PATH_SEPARATOR)
+        # 最后一段可能不完整，留到下一块
+        pending = parts.pop()
+        for part in parts:
+            # 与split_path_value相同：标准化后为空的条目（空白、""等）跳过
+            normalized = normalize_path(part)
+            if normalized:
+                yield normalized
+    
+    normalized = normalize_path(pending)
+    if normalized:
+        yield normalized
 
-class PathValidationWorker(QThread):
-    """路径验证工作线程"""
-    validation_progress = Signal(int, int)
-    path_validated = Signal(int, bool, str)
-    validation_complete = Signal()
+
+class PathValidationWorker(QObject):
+    """路径验证工作对象
     
-    def __init__(self, paths: List[str]):
-        super().__init__()
-        self.paths = paths
-        self.should_stop = False
+    常驻在对话框的验证线程中，通过排队的信号接收验证请求；
+    每个请求带有编号，新请求到达后旧请求会尽快放弃。
+    """
+    validation_progress = Signal(int, int, int)  # 请求编号, 已完成数, 总数
+    # 批量结果：(请求编号, [(索引, 是否有效, 错误信息), ...])
+    paths_validated = Signal(int, object)
+    validation_complete = Signal(int)  # 请求编号
     
-    def run(self):
-        total = len(self.paths)
-        for i, path in enumerate(self.paths):
-            if self.should_stop:
-                break
+    # 每批验证并发送的路径条数，批与批之间检查请求是否已失效
+    BATCH_SIZE = 16
+    
+    def __init__(self):
+        super().__init__()
+        self._active_request = 0
+    
+    def set_active_request(self, request_id: int):
+        """设置当前有效的请求编号（可在任意线程调用）"""
+        self._active_request = request_id
+    
+    def validate(self, request_id: int, paths: List[str]):
+        """按批验证路径列表，每批完成后立即发送结果和进度"""
+        total = len(paths)
+        for start in range(0, total, self.BATCH_SIZE):
+            if request_id != self._active_request:
+                return
+            
+            chunk = paths[start:start + self.BATCH_SIZE]
             try:
-                is_valid = validate_path(path)
-                error_msg = "" if is_valid else "路径无效或不存在"
-                self.path_validated.emit(i, is_valid, error_msg)
+                # 按父目录批量检查，减少文件系统调用
+                results = batch_validate_paths(chunk)
+                error = None
             except Exception as e:
-                self.path_validated.emit(i, False, str(e))
-            self.validation_progress.emit(i + 1, total)
-        self.validation_complete.emit()
+                results = [False] * len(chunk)
+                error = str(e)
+            
+            batch = [
+                (start + i, is_valid,
+                 error if error is not None else ("" if is_valid else "路径无效或不存在"))
+                for i, is_valid in enumerate(results)
+            ]
+            self.paths_validated.emit(request_id, batch)
+            self.validation_progress.emit(request_id, start + len(chunk), total)
+        
+        if request_id == self._active_request:
+            self.validation_complete.emit(request_id)
     
     def stop(self):
-        self.should_stop = True
+        """使所有未完成的请求失效"""
+        self._active_request = -1
+
+
+def _open_path_key(env_type: EnvType):
+    """以只读方式打开保存PATH变量的注册表键"""
+    if env_type == EnvType.SYSTEM:
+        root_key = winreg.HKEY_LOCAL_MACHINE
+        key_path = r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment"
+    else:
+        root_key = winreg.HKEY_CURRENT_USER
+        key_path = "Environment"
+    
+    return winreg.OpenKey(root_key, key_path, 0, winreg.KEY_READ)
+
+
+class RegistryReadSignals(QObject):
+    """注册表读取任务信号"""
+    finished = Signal(object, object)  # PATH值, 异常
+
+
+class RegistryReadJob(QRunnable):
+    """在线程池中读取PATH注册表值的任务"""
+    
+    def __init__(self, env_type: EnvType):
+        super().__init__()
+        self.env_type = env_type
+        self.signals = RegistryReadSignals()
+    
+    def run(self):
+        value = None
+        error = None
+        try:
+            with _open_path_key(self.env_type) as reg_key:
+                value, _ = winreg.QueryValueEx(reg_key, "PATH")
+        except Exception as e:
+            error = e
+        self.signals.finished.emit(value, error)
 
 
 class PathListWidget(QListWidget):
-    """支持拖拽的路径列表组件"""
-    paths_reordered = Signal(list)
+    """支持拖拽的路径列表组件
+    
+    每行在UserRole中保存其在路径列表中的索引，拖拽和删除只发出行号，
+    由对话框根据自己的路径列表更新，避免逐行读取文本。
+    """
+    rows_reordered = Signal(object)  # 新顺序对应的原始行号列表
+    rows_removed = Signal(object)  # 被删除的行号列表（升序）
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -65,8 +159,9 @@ class PathListWidget(QListWidget):
     
     def dropEvent(self, event):
         super().dropEvent(event)
-        paths = [self.item(i).text() for i in range(self.count())]
-        self.paths_reordered.emit(paths)
+        role = Qt.ItemDataRole.UserRole
+        order = [self.item(i).data(role) for i in range(self.count())]
+        self.rows_reordered.emit(order)
     
     def _show_context_menu(self, position):
         item = self.itemAt(position)
@@ -90,10 +185,10 @@ class PathListWidget(QListWidget):
         menu.exec(self.mapToGlobal(position))
     
     def _delete_selected(self):
-        for item in self.selectedItems():
-            self.takeItem(self.row(item))
-        paths = [self.item(i).text() for i in range(self.count())]
-        self.paths_reordered.emit(paths)
+        rows = sorted(self.row(item) for item in self.selectedItems())
+        for row in reversed(rows):
+            self.takeItem(row)
+        self.rows_removed.emit(rows)
     
     def _copy_path(self):
         item = self.currentItem()
@@ -110,15 +205,63 @@ class PathListWidget(QListWidget):
 class PathEditorDialog(QDialog):
     """PATH变量专用编辑器对话框"""
     path_updated = Signal(str)
+    validate_requested = Signal(int, object)
+    
+    # 搜索过滤防抖延迟（毫秒）
+    FILTER_DELAY_MS = 150
+    
+    # 详细信息中预览标签页的索引
+    PREVIEW_TAB_INDEX = 1
+    
+    # 路径状态颜色
+    _COLOR_VALID = QColor(144, 238, 144)  # 浅绿色
+    _COLOR_INVALID = QColor(211, 211, 211)  # 浅灰色
+    _COLOR_UNKNOWN = QColor(255, 255, 255)  # 白色（待验证）
     
     def __init__(self, parent=None, env_type: EnvType = EnvType.USER):
         super().__init__(parent)
         
         self.env_type = env_type
         self.path_controller = PathController()
-        self.validation_worker = None
+        
+        # 验证工作对象常驻在同一个线程中，避免每次验证都创建线程
+        self._validation_request = 0
+        self._validation_paths: List[str] = []
+        # 与_validation_paths对齐，请求发出时各路径在current_paths中的行号
+        self._validation_rows: List[int] = []
+        self._validation_thread = QThread(self)
+        self.validation_worker = PathValidationWorker()
+        self.validation_worker.moveToThread(self._validation_thread)
+        self.validation_worker.validation_progress.connect(self._on_validation_progress)
+        self.validation_worker.paths_validated.connect(self._on_paths_validated)
+        self.validation_worker.validation_complete.connect(self._on_validation_complete)
+        self.validate_requested.connect(self.validation_worker.validate)
+        self._validation_thread.finished.connect(self.validation_worker.deleteLater)
+        self._validation_thread.start()
+        
         self.original_paths: List[str] = []
         self.current_paths: List[str] = []
+        # 修改计数，为0时说明current_paths与original_paths一致
+        self._mutation_seq = 0
+        # 路径有效性缓存，避免同一路径重复访问文件系统
+        self._valid_cache: Dict[str, bool] = {}
+        # 与current_paths对齐的小写路径，供搜索过滤使用
+        self._paths_lower: List[str] = []
+        # 小写路径集合，Windows路径不区分大小写，用于O(1)判断是否已存在
+        self._path_set = set()
+        
+        # 后台读取注册表的任务
+        self._registry_job: Optional[RegistryReadJob] = None
+        self._closed = False
+        
+        # 预览标签页不可见时只标记，切换过去时再生成
+        self._preview_dirty = True
+        
+        # 搜索过滤防抖
+        self._pending_filter = ""
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.timeout.connect(self._apply_filter)
         
         type_name = "系统" if env_type == EnvType.SYSTEM else "用户"
         self.setWindowTitle(f"PATH编辑器 - {type_name}变量")
@@ -129,7 +272,6 @@ class PathEditorDialog(QDialog):
         self._init_ui()
         self._setup_connections()
         self._load_current_path()
-        self._validate_all_paths()
     
     def _init_ui(self):
         main_layout = QVBoxLayout(self)
@@ -267,11 +409,13 @@ class PathEditorDialog(QDialog):
         self.valid_paths_label = QLabel("有效路径: 0")
         self.invalid_paths_label = QLabel("无效路径: 0")
         self.duplicate_paths_label = QLabel("重复路径: 0")
+        self.pending_paths_label = QLabel("待验证路径: 0")
         
         stats_group_layout.addWidget(self.total_paths_label)
         stats_group_layout.addWidget(self.valid_paths_label)
         stats_group_layout.addWidget(self.invalid_paths_label)
         stats_group_layout.addWidget(self.duplicate_paths_label)
+        stats_group_layout.addWidget(self.pending_paths_label)
         
         stats_layout.addWidget(stats_group)
         
@@ -322,12 +466,16 @@ class PathEditorDialog(QDialog):
     def _setup_connections(self):
         """设置信号连接"""
         # 路径列表事件
-        self.path_list.paths_reordered.connect(self._on_paths_reordered)
+        self.path_list.rows_reordered.connect(self._on_rows_reordered)
+        self.path_list.rows_removed.connect(self._on_rows_removed)
         self.path_list.itemSelectionChanged.connect(self._update_selection_info)
         
         # 搜索
         self.search_edit.textChanged.connect(self._filter_paths)
         
+        # 切换到预览页时刷新预览
+        self.details_tabs.currentChanged.connect(self._on_details_tab_changed)
+        
         # 快速添加
         self.browse_btn.clicked.connect(self._browse_folder)
         self.quick_add_btn.clicked.connect(self._quick_add_path)
@@ -341,47 +489,79 @@ class PathEditorDialog(QDialog):
     
     def _load_current_path(self):
         """加载当前PATH变量"""
-        try:
-            # 获取当前PATH值
-            current_value = ""
-            if self.env_type == EnvType.SYSTEM:
-                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
-                                  r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment") as key:
-                    current_value, _ = winreg.QueryValueEx(key, "PATH")
-            else:
-                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, "Environment") as key:
-                    current_value, _ = winreg.QueryValueEx(key, "PATH")
-            
-            # 解析路径
-            self.original_paths = split_path_value(current_value)
-            self.current_paths = self.original_paths.copy()
-            self._refresh_path_list()
-            
-        except Exception as e:
-            QMessageBox.warning(self, "错误", f"无法加载PATH变量: {e}")
+        # 在后台线程读取注册表，对话框可以先显示出来；
+        # 读取完成前禁止编辑，避免以不完整的列表覆盖PATH或编辑被加载结果丢弃
+        self.status_label.setText("加载中…")
+        self._set_editing_enabled(False)
+        self._registry_job = RegistryReadJob(self.env_type)
+        self._registry_job.signals.finished.connect(self._on_registry_read)
+        QThreadPool.globalInstance().start(self._registry_job)
+    
+    def _on_registry_read(self, current_value, error):
+        """处理后台读取的注册表PATH值"""
+        self._registry_job = None
+        
+        if self._closed:
+            return
+        
+        if error is not None:
+            # 加载失败时保持禁用，只能取消
+            self.status_label.setText("加载失败")
+            QMessageBox.warning(self, "错误", f"无法加载PATH变量: {error}")
             self.original_paths = []
             self.current_paths = []
+            return
+        
+        self.status_label.setText("就绪")
+        self._apply_loaded_path(current_value)
+        self._set_editing_enabled(True)
+    
+    def _set_editing_enabled(self, enabled: bool):
+        """启用或禁用所有可修改PATH的控件（取消按钮始终可用）"""
+        self.toolbar.setEnabled(enabled)
+        for action in self.toolbar.actions():
+            action.setEnabled(enabled)
+        for widget in (self.path_list, self.quick_add_edit, self.browse_btn, self.quick_add_btn,
+                       self.reset_btn, self.apply_btn, self.ok_btn):
+            widget.setEnabled(enabled)
+    
+    def _apply_loaded_path(self, current_value: str):
+        """解析PATH值并刷新列表"""
+        self._valid_cache.clear()
+        self.original_paths = split_path_value(current_value)
+        self.current_paths = self.original_paths.copy()
+        self._mutation_seq = 0
+        self._refresh_path_list()
+    
+    def done(self, result: int):
+        """关闭对话框时停止验证线程"""
+        self._closed = True
+        self.validation_worker.stop()
+        self._validation_thread.quit()
+        self._validation_thread.wait()
+        super().done(result)
     
     def _validate_all_paths(self):
         """验证所有路径"""
-        if self.validation_worker and self.validation_worker.isRunning():
-            self.validation_worker.stop()
-            self.validation_worker.wait()
+        self._start_validation(list(range(len(self.current_paths))))
+    
+    def _start_validation(self, rows: List[int]):
+        """在后台验证current_paths中指定行的路径"""
+        # 新请求编号使正在进行的验证失效
+        self._validation_request += 1
+        self.validation_worker.set_active_request(self._validation_request)
         
-        if not self.current_paths:
+        if not rows:
             self._update_statistics()
             return
         
-        self.validation_worker = PathValidationWorker(self.current_paths)
-        self.validation_worker.validation_progress.connect(self._on_validation_progress)
-        self.validation_worker.path_validated.connect(self._on_path_validated)
-        self.validation_worker.validation_complete.connect(self._on_validation_complete)
-        
-        self.validation_progress.setMaximum(len(self.current_paths))
+        self.validation_progress.setMaximum(len(rows))
         self.validation_progress.setValue(0)
         self.validation_status.setText("验证中...")
         
-        self.validation_worker.start()
+        self._validation_rows = rows
+        self._validation_paths = [self.current_paths[row] for row in rows]
+        self.validate_requested.emit(self._validation_request, self._validation_paths)
     
     def _add_path(self):
         """添加新路径"""
@@ -407,8 +587,8 @@ class PathEditorDialog(QDialog):
                 self.current_paths.pop(row)
                 self.path_list.takeItem(row)
             
-            self._refresh_path_list()
-            self._update_preview()
+            self._mutation_seq += 1
+            self._refresh_path_list_incremental()
     
     def _move_path_up(self):
         """向上移动路径"""
@@ -417,10 +597,10 @@ class PathEditorDialog(QDialog):
             # 交换路径位置
             self.current_paths[current_row], self.current_paths[current_row - 1] = \
                 self.current_paths[current_row - 1], self.current_paths[current_row]
+            self._mutation_seq += 1
             
-            self._refresh_path_list()
+            self._refresh_path_list_incremental()
             self.path_list.setCurrentRow(current_row - 1)
-            self._update_preview()
     
     def _move_path_down(self):
         """向下移动路径"""
@@ -429,14 +609,14 @@ class PathEditorDialog(QDialog):
             # 交换路径位置
             self.current_paths[current_row], self.current_paths[current_row + 1] = \
                 self.current_paths[current_row + 1], self.current_paths[current_row]
+            self._mutation_seq += 1
             
-            self._refresh_path_list()
+            self._refresh_path_list_incremental()
             self.path_list.setCurrentRow(current_row + 1)
-            self._update_preview()
     
     def _cleanup_invalid_paths(self):
         """清理无效路径"""
-        valid_paths = [path for path in self.current_paths if validate_path(path)]
+        valid_paths = [path for path in self.current_paths if self._is_valid(path)]
         removed_count = len(self.current_paths) - len(valid_paths)
         
         if removed_count > 0:
@@ -448,29 +628,26 @@ class PathEditorDialog(QDialog):
             
             if reply == QMessageBox.StandardButton.Yes:
                 self.current_paths = valid_paths
-                self._refresh_path_list()
-                self._update_preview()
+                self._mutation_seq += 1
+                self._refresh_path_list_incremental()
                 QMessageBox.information(self, "清理完成", f"已移除 {removed_count} 个无效路径")
         else:
             QMessageBox.information(self, "清理完成", "没有发现无效路径")
     
     def _remove_duplicates(self):
         """移除重复路径"""
-        seen = set()
-        unique_paths = []
-        
+        # 按小写路径去重，保留首次出现的写法和顺序
+        unique = {}
         for path in self.current_paths:
-            path_lower = path.lower()
-            if path_lower not in seen:
-                seen.add(path_lower)
-                unique_paths.append(path)
+            unique.setdefault(path.lower(), path)
+        unique_paths = list(unique.values())
         
         removed_count = len(self.current_paths) - len(unique_paths)
         
         if removed_count > 0:
             self.current_paths = unique_paths
-            self._refresh_path_list()
-            self._update_preview()
+            self._mutation_seq += 1
+            self._refresh_path_list_incremental()
             QMessageBox.information(self, "去重完成", f"已移除 {removed_count} 个重复路径")
         else:
             QMessageBox.information(self, "去重完成", "没有发现重复路径")
@@ -484,12 +661,9 @@ class PathEditorDialog(QDialog):
         if file_path:
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
+                    imported_paths = list(_iter_path_segments(f))
                 
-                imported_paths = split_path_value(content)
-                self.current_paths.extend(imported_paths)
-                self._refresh_path_list()
-                self._update_preview()
+                self._append_path_items(imported_paths)
                 
                 QMessageBox.information(self, "导入成功", f"已导入 {len(imported_paths)} 个路径")
                 
@@ -528,50 +702,152 @@ class PathEditorDialog(QDialog):
     
     def _add_path_to_list(self, path: str):
         """添加路径到列表"""
-        if path not in self.current_paths:
+        if path.lower() not in self._path_set:
+            # 新添加的路径可能刚刚创建，重新检查
+            self._valid_cache.pop(path, None)
             self.current_paths.append(path)
-            self._refresh_path_list()
-            self._update_preview()
+            self._mutation_seq += 1
+            self._refresh_path_list_incremental()
     
     def _refresh_path_list(self):
         """刷新路径列表显示"""
-        self.path_list.clear()
-        for path in self.current_paths:
-            item = QListWidgetItem(path)
-            # 设置路径状态颜色
-            if validate_path(path):
-                item.setBackground(QColor(144, 238, 144))  # 浅绿色
+        # 重建期间暂停重绘和信号，避免每添加一行都触发布局
+        self.path_list.setUpdatesEnabled(False)
+        self.path_list.blockSignals(True)
+        try:
+            self.path_list.clear()
+            for path in self.current_paths:
+                item = QListWidgetItem(path)
+                item.setData(Qt.ItemDataRole.UserRole, self.path_list.count())
+                # 设置路径状态颜色（未验证的路径交给后台线程）
+                item.setBackground(self._status_color(path))
+                self.path_list.addItem(item)
+        finally:
+            self.path_list.blockSignals(False)
+            self.path_list.setUpdatesEnabled(True)
+        
+        self._paths_lower = [path.lower() for path in self.current_paths]
+        self._path_set = set(self._paths_lower)
+        self._reapply_filter()
+        self._update_statistics()
+        self._update_preview()
+        self._validate_pending_paths()
+    
+    def _refresh_path_list_incremental(self):
+        """增量刷新路径列表，只更新内容发生变化的行"""
+        path_count = len(self.current_paths)
+        
+        # 移除多余的行
+        while self.path_list.count() > path_count:
+            self.path_list.takeItem(self.path_list.count() - 1)
+        
+        role = Qt.ItemDataRole.UserRole
+        for row, path in enumerate(self.current_paths):
+            item = self.path_list.item(row)
+            if item is None:
+                item = QListWidgetItem(path)
+                self.path_list.addItem(item)
+            elif item.text() == path:
+                # 删除或移动后行号可能已变化
+                item.setData(role, row)
+                continue
             else:
-                item.setBackground(QColor(211, 211, 211))  # 浅灰色
+                item.setText(path)
+                item.setToolTip("")
+            item.setData(role, row)
             
-            self.path_list.addItem(item)
+            # 有效性来自缓存，新路径交给后台线程验证
+            item.setBackground(self._status_color(path))
         
+        self._paths_lower = [path.lower() for path in self.current_paths]
+        self._path_set = set(self._paths_lower)
+        self._reapply_filter()
         self._update_statistics()
         self._update_preview()
+        self._validate_pending_paths()
+    
+    def _append_path_items(self, paths: List[str]):
+        """在列表末尾追加路径，不重建已有的行"""
+        if not paths:
+            return
+        
+        self.current_paths.extend(paths)
+        self._mutation_seq += 1
+        self._paths_lower.extend(path.lower() for path in paths)
+        self._path_set.update(self._paths_lower[-len(paths):])
+        
+        self.path_list.setUpdatesEnabled(False)
+        try:
+            for path in paths:
+                item = QListWidgetItem(path)
+                item.setData(Qt.ItemDataRole.UserRole, self.path_list.count())
+                item.setBackground(self._status_color(path))
+                self.path_list.addItem(item)
+        finally:
+            self.path_list.setUpdatesEnabled(True)
+        
+        self._reapply_filter()
+        self._update_statistics()
+        self._update_preview()
+        self._validate_pending_paths()
     
     def _update_statistics(self):
         """更新统计信息"""
         total = len(self.current_paths)
-        valid = sum(1 for path in self.current_paths if validate_path(path))
-        invalid = total - valid
-        
-        # 计算重复路径
-        seen = set()
+        valid = 0
+        pending = 0
         duplicates = 0
+        seen = set()
+        
+        # 单次遍历同时统计有效路径和重复路径，有效性只读缓存
+        cached = self._valid_cache.get
         for path in self.current_paths:
+            is_valid = cached(path)
+            if is_valid is None:
+                pending += 1
+            elif is_valid:
+                valid += 1
             path_lower = path.lower()
             if path_lower in seen:
                 duplicates += 1
             else:
                 seen.add(path_lower)
         
+        invalid = total - valid - pending
+        
         self.total_paths_label.setText(f"总路径数: {total}")
         self.valid_paths_label.setText(f"有效路径: {valid}")
         self.invalid_paths_label.setText(f"无效路径: {invalid}")
         self.duplicate_paths_label.setText(f"重复路径: {duplicates}")
+        self.pending_paths_label.setText(f"待验证路径: {pending}")
+    
+    def _status_color(self, path: str) -> QColor:
+        """根据缓存的验证结果返回路径背景色"""
+        is_valid = self._valid_cache.get(path)
+        if is_valid is None:
+            return self._COLOR_UNKNOWN
+        return self._COLOR_VALID if is_valid else self._COLOR_INVALID
+    
+    def _validate_pending_paths(self):
+        """只在后台验证尚未缓存结果的路径"""
+        rows = [row for row, path in enumerate(self.current_paths) if path not in self._valid_cache]
+        if rows:
+            self._start_validation(rows)
+    
+    def _is_valid(self, path: str) -> bool:
+        """检查路径有效性（带缓存）"""
+        is_valid = self._valid_cache.get(path)
+        if is_valid is None:
+            is_valid = self._valid_cache[path] = validate_path(path)
+        return is_valid
     
     def _update_preview(self):
         """更新预览"""
+        if self.details_tabs.currentIndex() != self.PREVIEW_TAB_INDEX:
+            self._preview_dirty = True
+            return
+        
+        self._preview_dirty = False
         path_value = join_path_value(self.current_paths)
         self.preview_text.setPlainText(path_value)
         
@@ -579,8 +855,9 @@ class PathEditorDialog(QDialog):
         changes = []
         if len(self.current_paths) != len(self.original_paths):
             changes.append(f"路径数量: {len(self.original_paths)} → {len(self.current_paths)}")
-        
-        if self.current_paths != self.original_paths:
+            changes.append("路径内容已修改")
+        elif self._mutation_seq and self.current_paths != self.original_paths:
+            # 只有发生过修改且长度相同时才需要逐项比较
             changes.append("路径内容已修改")
         
         if changes:
@@ -588,29 +865,77 @@ class PathEditorDialog(QDialog):
         else:
             self.changes_text.setPlainText("无变更")
     
-    def _on_paths_reordered(self, paths: List[str]):
-        """处理路径重新排序"""
-        self.current_paths = paths
+    def _on_details_tab_changed(self, index: int):
+        """详细信息标签页切换"""
+        if index == self.PREVIEW_TAB_INDEX and self._preview_dirty:
+            self._update_preview()
+    
+    def _on_rows_reordered(self, order: List[int]):
+        """处理路径拖拽重新排序"""
+        self.current_paths = [self.current_paths[row] for row in order]
+        self._mutation_seq += 1
+        self._paths_lower = [self._paths_lower[row] for row in order]
+        self._renumber_rows()
         self._update_preview()
     
-    def _on_validation_progress(self, current: int, total: int):
+    def _on_rows_removed(self, rows: List[int]):
+        """处理右键菜单删除的路径"""
+        for row in reversed(rows):
+            self.current_paths.pop(row)
+        self._mutation_seq += 1
+        self._refresh_path_list_incremental()
+    
+    def _renumber_rows(self):
+        """更新每行保存的行号"""
+        role = Qt.ItemDataRole.UserRole
+        for row in range(self.path_list.count()):
+            self.path_list.item(row).setData(role, row)
+    
+    def _on_validation_progress(self, request_id: int, current: int, total: int):
         """处理验证进度"""
+        # 忽略已被新请求取代的旧请求的进度
+        if request_id != self._validation_request:
+            return
         self.validation_progress.setValue(current)
         self.validation_status.setText(f"验证中... {current}/{total}")
     
-    def _on_path_validated(self, index: int, is_valid: bool, error_msg: str):
-        """处理单个路径验证结果"""
-        if index < self.path_list.count():
-            item = self.path_list.item(index)
-            if is_valid:
-                item.setBackground(QColor(144, 238, 144))  # 浅绿色
-                item.setToolTip("")
-            else:
-                item.setBackground(QColor(211, 211, 211))  # 浅灰色
-                item.setToolTip(error_msg)
-    
-    def _on_validation_complete(self):
+    def _on_paths_validated(self, request_id: int, results: list):
+        """处理一批路径验证结果"""
+        if request_id != self._validation_request:
+            return
+        
+        self.path_list.setUpdatesEnabled(False)
+        try:
+            for index, is_valid, error_msg in results:
+                # 工作线程的结果写回缓存，供界面后续使用
+                path = self._validation_paths[index]
+                self._valid_cache[path] = is_valid
+                
+                # 请求发出后列表可能已被移动或删除，只更新仍对应的行
+                row = self._validation_rows[index]
+                if row < len(self.current_paths) and self.current_paths[row] == path \
+                        and row < self.path_list.count():
+                    item = self.path_list.item(row)
+                    if is_valid:
+                        item.setBackground(self._COLOR_VALID)
+                        item.setToolTip("")
+                    else:
+                        item.setBackground(self._COLOR_INVALID)
+                        item.setToolTip(error_msg)
+        finally:
+            self.path_list.setUpdatesEnabled(True)
+    
+    def _on_validation_complete(self, request_id: int):
         """处理验证完成"""
+        if request_id != self._validation_request:
+            return
+        # 验证期间列表顺序发生变化时，按缓存补上颜色
+        current = self.current_paths
+        if any(row >= len(current) or current[row] != path
+               for row, path in zip(self._validation_rows, self._validation_paths)):
+            for row in range(min(self.path_list.count(), len(self.current_paths))):
+                self.path_list.item(row).setBackground(self._status_color(self.current_paths[row]))
+        
         self.validation_status.setText("验证完成")
         self._update_statistics()
     
@@ -619,13 +944,28 @@ class PathEditorDialog(QDialog):
         pass  # 可以在这里添加选中路径的详细信息显示
     
     def _filter_paths(self, text: str):
-        """过滤路径显示"""
-        for i in range(self.path_list.count()):
-            item = self.path_list.item(i)
-            if text.lower() in item.text().lower():
-                item.setHidden(False)
-            else:
-                item.setHidden(True)
+        """过滤路径显示（防抖）"""
+        self._pending_filter = text
+        self._filter_timer.start(self.FILTER_DELAY_MS)
+    
+    def _apply_filter(self):
+        """执行路径过滤"""
+        query = self._pending_filter.lower()
+        
+        # 批量修改可见性期间暂停重绘
+        self.path_list.setUpdatesEnabled(False)
+        try:
+            for i, path_lower in enumerate(self._paths_lower):
+                item = self.path_list.item(i)
+                if item is not None:
+                    item.setHidden(query not in path_lower)
+        finally:
+            self.path_list.setUpdatesEnabled(True)
+    
+    def _reapply_filter(self):
+        """行内容或行数变化后重新应用搜索过滤，使各行的隐藏状态与其当前路径一致"""
+        if self._pending_filter:
+            self._apply_filter()
     
     def _reset_paths(self):
         """重置到原始路径"""
@@ -636,17 +976,29 @@ class PathEditorDialog(QDialog):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
+            self._valid_cache.clear()
             self.current_paths = self.original_paths.copy()
+            self._mutation_seq = 0
             self._refresh_path_list()
     
     def _apply_changes(self):
         """应用更改"""
+        # 没有修改时不发送信号，避免多余的注册表写入和系统广播
+        if self._mutation_seq == 0 or self.current_paths == self.original_paths:
+            self.status_label.setText("无更改")
+            return
+        
         try:
             path_value = join_path_value(self.current_paths)
             # 这里会发送信号，由主程序处理实际的注册表写入
             self.path_updated.emit(path_value)
             self.status_label.setText("更改已应用")
             
+            # 已应用的值成为新的基准，重复点击应用不再发送
+            self.original_paths = list(self.current_paths)
+            self._mutation_seq = 0
+            self._update_preview()
+            
         except Exception as e:
             QMessageBox.warning(self, "应用失败", f"无法应用更改: {e}")
     
@@ -4,35 +4,139 @@
 应用程序的主界面窗口。
 """
 
+import html
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QTableWidget, QTableWidgetItem, QSplitter, 
     QMenuBar, QMenu, QToolBar, QStatusBar, QLabel,
     QLineEdit, QPushButton, QComboBox, QGroupBox,
-    QMessageBox, QApplication, QDialog
+    QMessageBox, QApplication, QDialog, QFrame
+)
+from PySide6.QtCore import (
+    Qt, QTimer, Signal, QPoint, QSize, QEvent, QObject, QRunnable, QThreadPool
 )
-from PySide6.QtCore import Qt, QTimer, Signal, QPoint, QSize
-from PySide6.QtGui import QAction, QKeySequence, QIcon
+from PySide6.QtGui import QAction, QActionGroup, QIcon
 
 # 导入自定义组件和控制器
 from .components.env_table import EnvTable
 from .components.search_widget import SearchWidget
-from .dialogs.edit_dialog import EditDialog
+from .shortcuts import KEY_SEQUENCES
 from ..core.env_controller import EnvController
 from ..models.env_model import EnvironmentVariable, EnvType
 from ..utils.config import ConfigManager
 from ..utils.constants import (
     APP_NAME, APP_VERSION, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT,
-    WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT, SHORTCUTS
+    WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT
 )
+from ..utils.helpers import format_env_value_display
 from ..utils.logger import get_logger
 
 
+# 动作定义: (键, 菜单文本, 工具栏文本, 快捷键名, 状态提示, 槽函数名, 图标主题名)
+_ACTION_SPECS = (
+    ('new', "新建变量(&N)", "新建", 'NEW', "创建新的环境变量", None, 'document-new'),
+    ('import', "导入(&I)", "导入", 'IMPORT', "从文件导入环境变量", None, 'document-open'),
+    ('export', "导出(&E)", "导出", 'EXPORT', "导出环境变量到文件", None, 'document-save-as'),
+    ('quit', "退出(&Q)", None, 'QUIT', "退出应用程序", 'close', 'application-exit'),
+    ('edit', "编辑变量(&E)", "编辑", 'EDIT', "编辑选中的环境变量", None, 'document-properties'),
+    ('delete', "删除变量(&D)", "删除", 'DELETE', "删除选中的环境变量", None, 'edit-delete'),
+    ('find', "查找(&F)", None, 'FIND', "查找环境变量", None, 'edit-find'),
+    ('refresh', "刷新(&R)", "刷新", 'REFRESH', "刷新环境变量列表", None, 'view-refresh'),
+    ('path_editor', "PATH编辑器(&P)", "PATH编辑器", None, "打开PATH变量专用编辑器", None, 'folder'),
+    ('backup', "备份管理(&B)", "备份", None, "管理环境变量备份", None, 'document-save'),
+    ('settings', "设置(&S)", None, None, "打开应用程序设置", None, 'preferences-system'),
+    ('manual', "用户手册(&M)", None, None, "打开用户手册", None, 'help-contents'),
+    ('about', "关于(&A)", None, None, "关于此应用程序", '_show_about_dialog', 'help-about'),
+)
+
+# 图标缓存，同名图标只查找一次，供菜单和工具栏共享
+_ICON_CACHE = {}
+
+
+def _icon(name: str) -> QIcon:
+    """获取系统主题图标（没有图标主题的平台上为空图标，只显示文字）"""
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = QIcon.fromTheme(name)
+        _ICON_CACHE[name] = icon
+    return icon
+
+
+def _get_edit_dialog():
+    """延迟导入编辑对话框（连同PATH编辑器），首次打开时才加载"""
+    from .dialogs.edit_dialog import EditDialog
+    return EditDialog
+
+
+@lru_cache(maxsize=128)
+def _render_info_html(name: str, env_type: EnvType, value: str) -> str:
+    """生成详细信息面板的富文本，按变量内容缓存，变量修改后自然失效"""
+    type_text = '系统变量' if env_type == EnvType.SYSTEM else '用户变量'
+    return (
+        f"<b>变量名:</b> {html.escape(name)}<br>"
+        f"<b>类型:</b> {type_text}<br>"
+        f"<b>变量值:</b><br>{html.escape(format_env_value_display(value))}"
+    )
+
+
+def _vline() -> QFrame:
+    """创建状态栏使用的竖直分隔线"""
+    line = QFrame()
+    line.setFrameShape(QFrame.Shape.VLine)
+    line.setFrameShadow(QFrame.Shadow.Sunken)
+    return line
+
+# 菜单结构: (菜单标题, 动作键列表)，None为分隔符，'view'为视图菜单的特殊内容
+_MENU_SPEC = (
+    ("文件(&F)", ('new', None, 'import', 'export', None, 'quit')),
+    ("编辑(&E)", ('edit', 'delete', None, 'find', 'refresh')),
+    ("视图(&V)", ('view',)),
+    ("工具(&T)", ('path_editor', 'backup', None, 'settings')),
+    ("帮助(&H)", ('manual', 'about')),
+)
+
+# 工具栏结构，None为分隔符
+_TOOLBAR_SPEC = (
+    'new', 'edit', 'delete', None,
+    'import', 'export', None,
+    'path_editor', 'backup', None,
+    'refresh',
+)
+
+
+class EnvLoadSignals(QObject):
+    """环境变量加载任务信号"""
+    finished = Signal(object, object)  # 环境变量列表, 异常
+
+
+class EnvLoadJob(QRunnable):
+    """在线程池中读取全部环境变量的任务"""
+    
+    def __init__(self, env_controller: EnvController):
+        super().__init__()
+        self.env_controller = env_controller
+        self.signals = EnvLoadSignals()
+    
+    def run(self):
+        env_vars = None
+        error = None
+        try:
+            env_vars = self.env_controller.get_all_variables()
+        except Exception as e:
+            error = e
+        self.signals.finished.emit(env_vars, error)
+
+
 class MainWindow(QMainWindow):
     """主窗口类"""
     
     # 自定义信号
     env_changed = Signal()  # 环境变量变更信号
+    env_var_changed = Signal(str, object, object)  # 控制器变更通知（动作, 变量, 旧值）
     
     # =====================================================================
     # 初始化相关方法
@@ -51,19 +155,24 @@ class MainWindow(QMainWindow):
         self._create_menu_bar()
         self._create_tool_bar()
         self._create_status_bar()
-        self._setup_shortcuts()
         
-        # 恢复窗口状态
-        self._restore_window_state()
+        # 依赖选中状态的按钮和动作，只在选中状态变化时切换
+        self._selection_dependent = [
+            self.edit_button, self.delete_button, self.duplicate_button,
+            self.all_actions['edit'], self.all_actions['delete']
+        ]
+        self._last_has_selection = False
+        
+        # 先使用默认大小，保存的窗口状态在事件循环启动后再读取和应用
+        self.resize(WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT)
+        QTimer.singleShot(0, self._restore_window_state)
         
         # 设置窗口事件处理
         self._setup_event_handlers()
         
-        # 加载环境变量数据
-        self._load_env_vars()
-        
-        # 初始化状态
-        self._update_status("准备就绪")
+        # 在后台加载环境变量数据，窗口先显示出来
+        self._env_load_job: Optional[EnvLoadJob] = None
+        self._load_env_vars_async()
     
     def _init_ui(self):
         """初始化用户界面"""
@@ -94,20 +203,25 @@ class MainWindow(QMainWindow):
         """恢复窗口状态"""
         window_config = self.config_manager.get_window_config()
         
-        # 设置窗口大小，确保转换为整数类型
-        width = int(window_config['width'])
-        height = int(window_config['height'])
-        self.resize(width, height)
-        
-        # 恢复窗口位置
-        if window_config['position']:
-            pos = window_config['position']
-            if isinstance(pos, (list, tuple)) and len(pos) >= 2:
-                self.move(QPoint(int(pos[0]), int(pos[1])))
-        
-        # 恢复最大化状态
-        if window_config['maximized']:
-            self.showMaximized()
+        # 合并大小、位置和最大化的重绘
+        self.setUpdatesEnabled(False)
+        try:
+            # 设置窗口大小，确保转换为整数类型
+            width = int(window_config['width'])
+            height = int(window_config['height'])
+            self.resize(width, height)
+            
+            # 恢复窗口位置
+            if window_config['position']:
+                pos = window_config['position']
+                if isinstance(pos, (list, tuple)) and len(pos) >= 2:
+                    self.move(QPoint(int(pos[0]), int(pos[1])))
+            
+            # 恢复最大化状态
+            if window_config['maximized']:
+                self.showMaximized()
+        finally:
+            self.setUpdatesEnabled(True)
     
     # =====================================================================
     # UI组件创建方法
@@ -131,6 +245,8 @@ class MainWindow(QMainWindow):
         
         self.info_label = QLabel("选择一个环境变量查看详细信息")
         self.info_label.setWordWrap(True)
+        # 内容固定为富文本，省去每次setText时的格式探测
+        self.info_label.setTextFormat(Qt.TextFormat.RichText)
         self.info_label.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.info_label.setStyleSheet("padding: 10px; background-color: #f5f5f5; border-radius: 5px;")
         info_layout.addWidget(self.info_label)
@@ -169,74 +285,41 @@ class MainWindow(QMainWindow):
         
         return splitter
     
+    def _create_actions(self):
+        """按照_ACTION_SPECS一次性创建菜单和工具栏共用的动作"""
+        self.all_actions = {}
+        for key, text, icon_text, shortcut, status_tip, slot, icon_name in _ACTION_SPECS:
+            action = QAction(_icon(icon_name), text, self)
+            if icon_text:
+                action.setIconText(icon_text)
+            if shortcut:
+                action.setShortcut(KEY_SEQUENCES[shortcut])
+            action.setStatusTip(status_tip)
+            if slot:
+                action.triggered.connect(getattr(self, slot))
+            self.all_actions[key] = action
+        
+        # 编辑和删除需要先选中变量
+        self.all_actions['edit'].setEnabled(False)
+        self.all_actions['delete'].setEnabled(False)
+    
     def _create_menu_bar(self):
         """创建菜单栏"""
+        self._create_actions()
         menubar = self.menuBar()
         
-        # 文件菜单
-        file_menu = menubar.addMenu("文件(&F)")
-        
-        # 新建
-        new_action = QAction("新建变量(&N)", self)
-        new_action.setShortcut(QKeySequence(SHORTCUTS['NEW']))
-        new_action.setStatusTip("创建新的环境变量")
-        file_menu.addAction(new_action)
-        
-        file_menu.addSeparator()
-        
-        # 导入
-        import_action = QAction("导入(&I)", self)
-        import_action.setShortcut(QKeySequence(SHORTCUTS['IMPORT']))
-        import_action.setStatusTip("从文件导入环境变量")
-        file_menu.addAction(import_action)
-        
-        # 导出
-        export_action = QAction("导出(&E)", self)
-        export_action.setShortcut(QKeySequence(SHORTCUTS['EXPORT']))
-        export_action.setStatusTip("导出环境变量到文件")
-        file_menu.addAction(export_action)
-        
-        file_menu.addSeparator()
-        
-        # 退出
-        quit_action = QAction("退出(&Q)", self)
-        quit_action.setShortcut(QKeySequence(SHORTCUTS['QUIT']))
-        quit_action.setStatusTip("退出应用程序")
-        quit_action.triggered.connect(self.close)
-        file_menu.addAction(quit_action)
-        
-        # 编辑菜单
-        edit_menu = menubar.addMenu("编辑(&E)")
-        
-        # 编辑
-        edit_action = QAction("编辑变量(&E)", self)
-        edit_action.setShortcut(QKeySequence(SHORTCUTS['EDIT']))
-        edit_action.setStatusTip("编辑选中的环境变量")
-        edit_menu.addAction(edit_action)
-        
-        # 删除
-        delete_action = QAction("删除变量(&D)", self)
-        delete_action.setShortcut(QKeySequence(SHORTCUTS['DELETE']))
-        delete_action.setStatusTip("删除选中的环境变量")
-        edit_menu.addAction(delete_action)
-        
-        edit_menu.addSeparator()
-        
-        # 查找
-        find_action = QAction("查找(&F)", self)
-        find_action.setShortcut(QKeySequence(SHORTCUTS['FIND']))
-        find_action.setStatusTip("查找环境变量")
-        edit_menu.addAction(find_action)
-        
-        # 刷新
-        refresh_action = QAction("刷新(&R)", self)
-        refresh_action.setShortcut(QKeySequence(SHORTCUTS['REFRESH']))
-        refresh_action.setStatusTip("刷新环境变量列表")
-        edit_menu.addAction(refresh_action)
-        
-        # 视图菜单
-        view_menu = menubar.addMenu("视图(&V)")
-        
+        for title, keys in _MENU_SPEC:
+            menu = menubar.addMenu(title)
+            for key in keys:
+                if key is None:
+                    menu.addSeparator()
+                elif key == 'view':
+                    self._populate_view_menu(menu)
+                else:
+                    menu.addAction(self.all_actions[key])
+    
+    def _populate_view_menu(self, view_menu: QMenu):
+        """填充视图菜单"""
         # 显示系统变量
         show_system_action = QAction("显示系统变量", self)
         show_system_action.setCheckable(True)
@@ -251,129 +334,29 @@ class MainWindow(QMainWindow):
         
         view_menu.addSeparator()
         
-        # 切换主题
+        # 切换主题（互斥选项由动作组管理）
         theme_menu = view_menu.addMenu("主题")
-        light_theme_action = QAction("浅色主题", self)
+        theme_group = QActionGroup(self)
+        light_theme_action = theme_group.addAction("浅色主题")
         light_theme_action.setCheckable(True)
         light_theme_action.setChecked(True)
-        theme_menu.addAction(light_theme_action)
         
-        dark_theme_action = QAction("深色主题", self)
+        dark_theme_action = theme_group.addAction("深色主题")
         dark_theme_action.setCheckable(True)
-        theme_menu.addAction(dark_theme_action)
-        
-        # 工具菜单
-        tools_menu = menubar.addMenu("工具(&T)")
-        
-        # PATH编辑器
-        path_editor_action = QAction("PATH编辑器(&P)", self)
-        path_editor_action.setStatusTip("打开PATH变量专用编辑器")
-        tools_menu.addAction(path_editor_action)
-        
-        # 备份管理
-        backup_action = QAction("备份管理(&B)", self)
-        backup_action.setStatusTip("管理环境变量备份")
-        tools_menu.addAction(backup_action)
-        
-        tools_menu.addSeparator()
-        
-        # 设置
-        settings_action = QAction("设置(&S)", self)
-        settings_action.setStatusTip("打开应用程序设置")
-        tools_menu.addAction(settings_action)
-        
-        # 帮助菜单
-        help_menu = menubar.addMenu("帮助(&H)")
-        
-        # 用户手册
-        manual_action = QAction("用户手册(&M)", self)
-        manual_action.setStatusTip("打开用户手册")
-        help_menu.addAction(manual_action)
-        
-        # 关于
-        about_action = QAction("关于(&A)", self)
-        about_action.setStatusTip("关于此应用程序")
-        about_action.triggered.connect(self._show_about_dialog)
-        help_menu.addAction(about_action)
-        
-        # 保存菜单动作引用
-        self.menu_actions = {
-            'new': new_action,
-            'edit': edit_action,
-            'delete': delete_action,
-            'import': import_action,
-            'export': export_action,
-            'find': find_action,
-            'refresh': refresh_action,
-            'path_editor': path_editor_action,
-            'backup': backup_action,
-            'settings': settings_action
-        }
+        theme_menu.addActions(theme_group.actions())
     
     def _create_tool_bar(self):
         """创建工具栏"""
         toolbar = self.addToolBar("主工具栏")
         toolbar.setMovable(False)
+        toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         
-        # 新建按钮
-        new_action = QAction("新建", self)
-        new_action.setStatusTip("创建新的环境变量")
-        toolbar.addAction(new_action)
-        
-        # 编辑按钮
-        edit_action = QAction("编辑", self)
-        edit_action.setStatusTip("编辑选中的环境变量")
-        edit_action.setEnabled(False)
-        toolbar.addAction(edit_action)
-        
-        # 删除按钮
-        delete_action = QAction("删除", self)
-        delete_action.setStatusTip("删除选中的环境变量")
-        delete_action.setEnabled(False)
-        toolbar.addAction(delete_action)
-        
-        toolbar.addSeparator()
-        
-        # 导入按钮
-        import_action = QAction("导入", self)
-        import_action.setStatusTip("从文件导入环境变量")
-        toolbar.addAction(import_action)
-        
-        # 导出按钮
-        export_action = QAction("导出", self)
-        export_action.setStatusTip("导出环境变量到文件")
-        toolbar.addAction(export_action)
-        
-        toolbar.addSeparator()
-        
-        # PATH编辑器按钮
-        path_editor_action = QAction("PATH编辑器", self)
-        path_editor_action.setStatusTip("打开PATH变量专用编辑器")
-        toolbar.addAction(path_editor_action)
-        
-        # 备份按钮
-        backup_action = QAction("备份", self)
-        backup_action.setStatusTip("管理环境变量备份")
-        toolbar.addAction(backup_action)
-        
-        toolbar.addSeparator()
-        
-        # 刷新按钮
-        refresh_action = QAction("刷新", self)
-        refresh_action.setStatusTip("刷新环境变量列表")
-        toolbar.addAction(refresh_action)
-        
-        # 保存工具栏动作引用
-        self.toolbar_actions = {
-            'new': new_action,
-            'edit': edit_action,
-            'delete': delete_action,
-            'import': import_action,
-            'export': export_action,
-            'path_editor': path_editor_action,
-            'backup': backup_action,
-            'refresh': refresh_action
-        }
+        # 工具栏与菜单共用同一组动作，按钮上显示iconText
+        for key in _TOOLBAR_SPEC:
+            if key is None:
+                toolbar.addSeparator()
+            else:
+                toolbar.addAction(self.all_actions[key])
     
     def _create_status_bar(self):
         """创建状态栏"""
@@ -385,38 +368,30 @@ class MainWindow(QMainWindow):
         self.status_bar.addWidget(self.status_label)
         
         # 添加分隔符
-        self.status_bar.addPermanentWidget(QLabel("|"))
+        self.status_bar.addPermanentWidget(_vline())
         
         # 环境变量计数
         self.env_count_label = QLabel("环境变量: 0")
         self.status_bar.addPermanentWidget(self.env_count_label)
         
         # 添加分隔符
-        self.status_bar.addPermanentWidget(QLabel("|"))
+        self.status_bar.addPermanentWidget(_vline())
         
         # 当前时间
         self.time_label = QLabel()
+        self._last_time = ""
         self.status_bar.addPermanentWidget(self.time_label)
         
-        # 创建定时器更新时间
+        # 创建定时器更新时间（只显示到分钟，每次在下一整分钟触发）
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self._update_time)
-        self.timer.start(1000)  # 每秒更新一次
         self._update_time()
     
     # =====================================================================
     # 事件处理设置方法
     # =====================================================================
     
-    def _setup_shortcuts(self):
-        """设置快捷键"""
-        # 连接快捷键到相应动作
-        if hasattr(self, 'menu_actions'):
-            for action_name, action in self.menu_actions.items():
-                if action_name in ['new', 'edit', 'delete', 'import', 'export', 'find', 'refresh']:
-                    # 这些动作将在后续实现中连接到具体的槽函数
-                    pass
-    
     def _setup_event_handlers(self):
         """设置事件处理器"""
         # 环境变量表格事件
@@ -425,8 +400,7 @@ class MainWindow(QMainWindow):
         self.env_table.duplicate_requested.connect(self._on_duplicate_variable)
         
         # 获取内部表格组件的选择变化信号
-        if hasattr(self.env_table, 'table_widget'):
-            self.env_table.table_widget.selection_changed.connect(self._on_selection_changed)
+        self.env_table.table.selection_changed.connect(self._on_selection_changed)
         
         # 搜索事件
         self.search_widget.search_changed.connect(self._on_search_changed)
@@ -440,8 +414,9 @@ class MainWindow(QMainWindow):
         self.duplicate_button.clicked.connect(self._on_duplicate_clicked)
         self.refresh_button.clicked.connect(self._on_refresh_clicked)
         
-        # 环境变量控制器变更通知
-        self.env_controller.add_change_callback(self._on_env_changed)
+        # 环境变量控制器变更通知经信号转发，其他线程中的变更也会在GUI线程处理
+        self.env_var_changed.connect(self._on_env_changed)
+        self.env_controller.add_change_callback(self.env_var_changed.emit)
     
     # =====================================================================
     # 状态管理方法
@@ -450,17 +425,19 @@ class MainWindow(QMainWindow):
     def _save_window_state(self):
         """保存窗口状态"""
         is_maximized = self.isMaximized()
+        window_config = {'maximized': is_maximized}
         
+        # 最大化时保留之前保存的大小和位置
         if not is_maximized:
             size = self.size()
             pos = self.pos()
-            self.config_manager.set_window_config(
+            window_config.update(
                 width=size.width(),
                 height=size.height(),
                 position=(pos.x(), pos.y())
             )
         
-        self.config_manager.set_window_config(maximized=is_maximized)
+        self.config_manager.set_window_config(**window_config)
     
     def _update_status(self, message: str):
         """更新状态栏消息"""
@@ -468,9 +445,15 @@ class MainWindow(QMainWindow):
     
     def _update_time(self):
         """更新时间显示"""
-        from datetime import datetime
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.time_label.setText(current_time)
+        now = datetime.now()
+        current_time = now.strftime("%H:%M")
+        # 文本未变化时不触发重绘
+        if current_time != self._last_time:
+            self._last_time = current_time
+            self.time_label.setText(current_time)
+        
+        # 对齐到下一整分钟
+        self.timer.start(60000 - now.second * 1000 - now.microsecond // 1000)
     
     def _update_env_count(self, count: int):
         """更新环境变量计数"""
@@ -503,25 +486,52 @@ class MainWindow(QMainWindow):
             # 从控制器获取所有环境变量
             env_vars = self.env_controller.get_all_variables()
             
-            # 设置到表格组件
-            self.env_table.set_env_vars(env_vars)
-            
-            # 更新统计信息
-            self._update_env_count(len(env_vars))
-            
-            self._update_status(f"已加载 {len(env_vars)} 个环境变量")
-            self.logger.info(f"成功加载 {len(env_vars)} 个环境变量")
+            self._apply_env_vars(env_vars)
             
         except Exception as e:
-            error_msg = f"加载环境变量失败: {str(e)}"
-            self._update_status(error_msg)
-            self.logger.error(error_msg)
-            
-            QMessageBox.critical(
-                self,
-                "错误",
-                f"无法加载环境变量数据：\n{str(e)}"
-            )
+            self._show_load_error(e)
+    
+    def _load_env_vars_async(self):
+        """在线程池中加载环境变量数据，完成后在GUI线程中更新表格"""
+        if self._env_load_job is not None:
+            return
+        
+        self._update_status("正在加载环境变量...")
+        self._env_load_job = EnvLoadJob(self.env_controller)
+        self._env_load_job.signals.finished.connect(self._on_env_vars_loaded)
+        QThreadPool.globalInstance().start(self._env_load_job)
+    
+    def _on_env_vars_loaded(self, env_vars, error):
+        """处理后台加载的环境变量数据"""
+        self._env_load_job = None
+        
+        if error is not None:
+            self._show_load_error(error)
+        else:
+            self._apply_env_vars(env_vars)
+    
+    def _apply_env_vars(self, env_vars: list):
+        """将加载的环境变量设置到表格并更新统计"""
+        # 设置到表格组件
+        self.env_table.set_env_vars(env_vars)
+        
+        # 更新统计信息
+        self._update_env_count(len(env_vars))
+        
+        self._update_status(f"已加载 {len(env_vars)} 个环境变量")
+        self.logger.info(f"成功加载 {len(env_vars)} 个环境变量")
+    
+    def _show_load_error(self, error: Exception):
+        """显示加载环境变量失败的信息"""
+        error_msg = f"加载环境变量失败: {str(error)}"
+        self._update_status(error_msg)
+        self.logger.error(error_msg)
+        
+        QMessageBox.critical(
+            self,
+            "错误",
+            f"无法加载环境变量数据：\n{str(error)}"
+        )
     
     # =====================================================================
     # 选择和搜索事件处理方法
@@ -531,29 +541,22 @@ class MainWindow(QMainWindow):
         """处理表格选择变化"""
         has_selection = len(selected_vars) > 0
         
-        # 更新按钮状态
-        self.edit_button.setEnabled(has_selection)
-        self.delete_button.setEnabled(has_selection)
-        self.duplicate_button.setEnabled(has_selection)
-        
-        # 更新工具栏按钮状态
-        if hasattr(self, 'toolbar_actions'):
-            self.toolbar_actions['edit'].setEnabled(has_selection)
-            self.toolbar_actions['delete'].setEnabled(has_selection)
+        # 更新按钮和工具栏按钮状态
+        if has_selection != self._last_has_selection:
+            self._last_has_selection = has_selection
+            for widget in self._selection_dependent:
+                widget.setEnabled(has_selection)
         
         # 更新详细信息显示
         if has_selection:
             var = selected_vars[0]  # 显示第一个选中变量的信息
-            
-            info_text = f"<b>变量名:</b> {var.name}<br>"
-            info_text += f"<b>类型:</b> {'系统变量' if var.env_type == EnvType.SYSTEM else '用户变量'}<br>"
-            info_text += f"<b>变量值:</b><br>{var.display_value if hasattr(var, 'display_value') else var.value}"
+            info_html = _render_info_html(var.name, var.env_type, var.value)
             
             # 如果有多个选中项，显示选中数量
             if len(selected_vars) > 1:
-                info_text += f"<br><br><i>已选中 {len(selected_vars)} 个变量</i>"
+                info_html += f"<br><br><i>已选中 {len(selected_vars)} 个变量</i>"
             
-            self.info_label.setText(info_text)
+            self.info_label.setText(info_html)
         else:
             self.info_label.setText("选择一个环境变量查看详细信息")
     
@@ -561,8 +564,7 @@ class MainWindow(QMainWindow):
         """处理搜索文本变化"""
         # 实时搜索：当搜索框为空时显示所有变量，否则等待用户停止输入后搜索
         if not text.strip():
-            self._load_env_vars()
-            self._update_status("显示所有变量")
+            self._on_search_cleared()
         else:
             # 搜索框有内容时，显示提示但不立即搜索（等待search_changed信号）
             self._update_status("输入搜索条件...")
@@ -572,21 +574,15 @@ class MainWindow(QMainWindow):
         try:
             if not search_text.strip():
                 # 空搜索，显示所有变量
-                self._load_env_vars()
+                self._on_search_cleared()
                 return
             
-            # 执行搜索
-            all_vars = self.env_controller.get_all_variables()
-            filtered_vars = []
-            
-            for var in all_vars:
-                if self._matches_search(var, search_text, options):
-                    filtered_vars.append(var)
+            # 由表格的代理模型过滤，不需要重新读取和设置数据
+            self.env_table.set_search(search_text, options)
             
-            # 更新表格显示
-            self.env_table.set_env_vars(filtered_vars)
-            self._update_env_count(len(filtered_vars))
-            self._update_status(f"搜索结果: {len(filtered_vars)} 个变量")
+            visible_count = self.env_table.visible_count()
+            self._update_env_count(visible_count)
+            self._update_status(f"搜索结果: {visible_count} 个变量")
             
         except Exception as e:
             self.logger.error(f"搜索失败: {e}")
@@ -594,30 +590,10 @@ class MainWindow(QMainWindow):
     
     def _on_search_cleared(self):
         """处理搜索清除"""
-        self._load_env_vars()
+        self.env_table.set_search("", {})
+        self._update_env_count(len(self.env_table.get_env_vars()))
         self._update_status("显示所有变量")
     
-    def _matches_search(self, var: EnvironmentVariable, search_text: str, options: dict) -> bool:
-        """检查变量是否匹配搜索条件"""
-        search_text = search_text.lower()
-        search_type = options.get('search_type', '全部')
-        case_sensitive = options.get('case_sensitive', False)
-        
-        if not case_sensitive:
-            name = var.name.lower()
-            value = var.value.lower()
-        else:
-            name = var.name
-            value = var.value
-            search_text = search_text if case_sensitive else search_text.lower()
-        
-        if search_type == '变量名':
-            return search_text in name
-        elif search_type == '变量值':
-            return search_text in value
-        else:  # 全部
-            return search_text in name or search_text in value
-    
     # =====================================================================
     # 按钮点击事件处理方法
     # =====================================================================
@@ -625,7 +601,7 @@ class MainWindow(QMainWindow):
     def _on_new_clicked(self):
         """处理新建按钮点击"""
         try:
-            dialog = EditDialog(self)
+            dialog = _get_edit_dialog()(self)
             dialog.variable_saved.connect(self._on_variable_saved)
             
             if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -707,8 +683,16 @@ class MainWindow(QMainWindow):
         """处理环境变量变更通知"""
         self.logger.info(f"环境变量变更: {action} - {variable.name}")
         
-        # 刷新表格数据
-        self._load_env_vars()
+        # 只更新受影响的行，不重新读取全部变量
+        if action == "created":
+            self.env_table.add_env_var(variable)
+        elif action == "updated":
+            self.env_table.update_env_var(variable)
+        elif action == "deleted":
+            self.env_table.remove_env_var(variable)
+        else:
+            self._load_env_vars()
+        self._update_env_count(self.env_table.visible_count())
         
         # 发射变更信号
         self.env_changed.emit()
@@ -744,7 +728,7 @@ class MainWindow(QMainWindow):
     def _on_edit_variable(self, variable: EnvironmentVariable):
         """处理编辑变量请求"""
         try:
-            dialog = EditDialog(self, variable)
+            dialog = _get_edit_dialog()(self, variable)
             dialog.variable_saved.connect(self._on_variable_saved)
             
             if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -821,7 +805,7 @@ class MainWindow(QMainWindow):
             )
             
             # 打开编辑对话框让用户修改
-            dialog = EditDialog(self, new_var)
+            dialog = _get_edit_dialog()(self, new_var)
             dialog.variable_saved.connect(self._on_variable_saved)
             
             if dialog.exec() == QDialog.DialogCode.Accepted:
@@ -838,10 +822,7 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         """处理窗口关闭事件"""
-        # 保存窗口状态
-        self._save_window_state()
-        
-        # 询问是否确认退出
+        # 询问是否确认退出，取消时不写入配置
         if self.config_manager.get('general/confirm_exit', True):
             reply = QMessageBox.question(
                 self,
@@ -851,12 +832,13 @@ class MainWindow(QMainWindow):
                 QMessageBox.StandardButton.No
             )
             
-            if reply == QMessageBox.StandardButton.Yes:
-                event.accept()
-            else:
+            if reply != QMessageBox.StandardButton.Yes:
                 event.ignore()
-        else:
-            event.accept()
+                return
+        
+        # 确认退出后再保存窗口状态
+        self._save_window_state()
+        event.accept()
     
     def resizeEvent(self, event):
         """处理窗口大小变化事件"""
@@ -866,4 +848,10 @@ class MainWindow(QMainWindow):
     def changeEvent(self, event):
         """处理窗口状态变化事件"""
         super().changeEvent(event)
-        # 可以在这里处理窗口最小化、最大化等状态变化
+        
+        # 最小化时暂停时钟，恢复时立即刷新
+        if event.type() == QEvent.Type.WindowStateChange:
+            if self.isMinimized():
+                self.timer.stop()
+            elif not self.timer.isActive():
+                self._update_time()
@@ -0,0 +1,13 @@
+"""
+快捷键模块
+
+将常量中的快捷键字符串预先解析为QKeySequence，供菜单和右键菜单共享。
+"""
+
+from PySide6.QtGui import QKeySequence
+
+from ..utils.constants import SHORTCUTS
+
+
+# 预先解析的快捷键，避免每次创建动作时重复解析字符串
+KEY_SEQUENCES = {key: QKeySequence(value) for key, value in SHORTCUTS.items()}
@@ -4,14 +4,61 @@
 使用QSettings进行配置的读写操作。
 """
 
-from PySide6.QtCore import QSettings
-from typing import Any, Optional, Dict
+from PySide6.QtCore import QSettings, QTimer
+from typing import Any, Optional, Dict, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from types import MappingProxyType
 import os
+import shutil
 
 from .constants import CONFIG_DIR, CONFIG_FILE, APP_NAME, APP_AUTHOR
 from .helpers import ensure_directory
 
 
+# 默认配置（只读，导入时构建一次）
+_DEFAULTS = MappingProxyType({
+    # 窗口设置
+    'window/width': 800,
+    'window/height': 600,
+    'window/maximized': False,
+    'window/position': None,
+    
+    # 界面设置
+    'ui/theme': 'light',
+    'ui/language': 'zh_CN',
+    'ui/font_size': 9,
+    'ui/show_system_tray': True,
+    
+    # 功能设置
+    'general/auto_backup': True,
+    'general/backup_count': 10,
+    'general/confirm_delete': True,
+    'general/show_path_count': True,
+    
+    # 搜索设置
+    'search/case_sensitive': False,
+    'search/regex_enabled': False,
+    'search/remember_history': True,
+    
+    # 高级设置
+    'advanced/check_path_validity': True,
+    'advanced/auto_remove_duplicates': False,
+    'advanced/path_validation_timeout': 5,
+    
+    # 日志设置
+    'logging/level': 'INFO',
+    'logging/max_file_size': 10 * 1024 * 1024,  # 10MB
+    'logging/backup_count': 5,
+})
+
+# 修改后延迟写入磁盘的时间（毫秒），期间的连续修改合并为一次写入
+_SYNC_DELAY_MS = 500
+
+# 待写入队列中表示删除的标记
+_REMOVED = object()
+
+
 class ConfigManager:
     """配置管理器"""
     
@@ -25,88 +72,119 @@ class ConfigManager:
                                 QSettings.Scope.UserScope,
                                 APP_AUTHOR, APP_NAME)
         
+        # 批量写入的嵌套层数，最外层结束时同步到磁盘
+        self._batch_depth = 0
+        
+        # 尚未写入QSettings的修改（键 -> 值或_REMOVED），停止修改一段时间后统一写入
+        self._pending: Dict[str, Any] = {}
+        self._sync_timer = QTimer()
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(_SYNC_DELAY_MS)
+        self._sync_timer.timeout.connect(self.flush)
+        
         # 设置默认配置
         self._set_defaults()
+        
+        # 启动时一次性读入全部配置，之后的读取直接使用内存缓存
+        self._cache: Dict[str, Any] = {}
+        self._load_cache()
+    
+    def _load_cache(self) -> None:
+        """从QSettings重新载入配置缓存"""
+        self._cache = {key: self.settings.value(key) for key in self.settings.allKeys()}
     
     def _set_defaults(self) -> None:
         """设置默认配置值"""
-        defaults = {
-            # 窗口设置
-            'window/width': 800,
-            'window/height': 600,
-            'window/maximized': False,
-            'window/position': None,
-            
-            # 界面设置
-            'ui/theme': 'light',
-            'ui/language': 'zh_CN',
-            'ui/font_size': 9,
-            'ui/show_system_tray': True,
-            
-            # 功能设置
-            'general/auto_backup': True,
-            'general/backup_count': 10,
-            'general/confirm_delete': True,
-            'general/show_path_count': True,
-            
-            # 搜索设置
-            'search/case_sensitive': False,
-            'search/regex_enabled': False,
-            'search/remember_history': True,
-            
-            # 高级设置
-            'advanced/check_path_validity': True,
-            'advanced/auto_remove_duplicates': False,
-            'advanced/path_validation_timeout': 5,
-            
-            # 日志设置
-            'logging/level': 'INFO',
-            'logging/max_file_size': 10 * 1024 * 1024,  # 10MB
-            'logging/backup_count': 5,
-        }
-        
-        # 只有当配置不存在时才设置默认值
-        for key, value in defaults.items():
-            if not self.settings.contains(key):
-                self.settings.setValue(key, value)
+        # 只有当配置不存在时才设置默认值，一次取得已有键，全部写入后只同步一次
+        existing = set(self.settings.allKeys())
+        missing = [key for key in _DEFAULTS if key not in existing]
+        for key in missing:
+            self.settings.setValue(key, _DEFAULTS[key])
+        if missing:
+            self.settings.sync()
     
     def get(self, key: str, default: Any = None) -> Any:
         """获取配置值"""
-        return self.settings.value(key, default)
+        return self._cache.get(key, default)
     
     def set(self, key: str, value: Any) -> None:
         """设置配置值"""
-        self.settings.setValue(key, value)
-        self.settings.sync()
+        self._cache[key] = value
+        self._pending.pop(key, None)
+        self._pending[key] = value
+        self._sync_timer.start()
     
     def remove(self, key: str) -> None:
-        """移除配置项"""
-        self.settings.remove(key)
+        """移除配置项（与QSettings一致，同时移除该键下的子项）"""
+        prefix = key + '/'
+        for cached_key in [k for k in self._cache if k == key or k.startswith(prefix)]:
+            del self._cache[cached_key]
+        for pending_key in [k for k in self._pending if k == key or k.startswith(prefix)]:
+            del self._pending[pending_key]
+        self._pending[key] = _REMOVED
+        self._sync_timer.start()
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """批量修改配置，最外层退出时同步一次"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+    
+    def flush(self) -> None:
+        """将修改同步到磁盘
+        
+        set()和remove()只记录修改，停止修改_SYNC_DELAY_MS毫秒后才写入，
+        需要确保落盘时（如退出前）调用此方法。
+        """
+        self._sync_timer.stop()
+        pending, self._pending = self._pending, {}
+        for key, value in pending.items():
+            if value is _REMOVED:
+                self.settings.remove(key)
+            else:
+                self.settings.setValue(key, value)
         self.settings.sync()
     
     def contains(self, key: str) -> bool:
         """检查配置项是否存在"""
-        return self.settings.contains(key)
+        return key in self._cache
     
     def get_all_keys(self) -> list:
         """获取所有配置键"""
-        return self.settings.allKeys()
+        return list(self._cache)
     
     def clear(self) -> None:
         """清空所有配置"""
+        self._sync_timer.stop()
+        self._pending.clear()
         self.settings.clear()
+        
+        # 清空后只剩默认值，直接写入全部默认值并同步一次，无需逐项检查和重新读取
+        for key, value in _DEFAULTS.items():
+            self.settings.setValue(key, value)
         self.settings.sync()
-        self._set_defaults()
+        self._cache = dict(_DEFAULTS)
     
     def export_config(self, file_path: str) -> bool:
         """导出配置到文件"""
         try:
-            # 创建临时设置对象用于导出
+            # 配置本身就是INI文件，先写出未同步的修改，再直接复制文件
+            self.flush()
+            source_file = self.settings.fileName()
+            if source_file and os.path.isfile(source_file):
+                shutil.copyfile(source_file, file_path)
+                return True
+            
+            # 无法取得配置文件时，创建临时设置对象逐项导出
             export_settings = QSettings(file_path, QSettings.Format.IniFormat)
             
             # 复制所有设置
-            for key in self.settings.allKeys():
-                value = self.settings.value(key)
+            for key, value in self._cache.items():
                 export_settings.setValue(key, value)
             
             export_settings.sync()
@@ -120,12 +198,16 @@ class ConfigManager:
             if not os.path.exists(file_path):
                 return False
             
+            # 先写出未同步的修改，避免其稍后覆盖导入的值
+            self.flush()
+            
             # 创建临时设置对象用于导入
             import_settings = QSettings(file_path, QSettings.Format.IniFormat)
             
             # 复制所有设置
             for key in import_settings.allKeys():
                 value = import_settings.value(key)
+                self._cache[key] = value
                 self.settings.setValue(key, value)
             
             self.settings.sync()
@@ -137,7 +219,6 @@ class ConfigManager:
         """备份当前配置"""
         try:
             if backup_path is None:
-                from datetime import datetime
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 backup_filename = f"config_backup_{timestamp}.ini"
                 backup_path = os.path.join(CONFIG_DIR, backup_filename)
@@ -160,14 +241,15 @@ class ConfigManager:
     def set_window_config(self, width: Optional[int] = None, height: Optional[int] = None, 
                          maximized: Optional[bool] = None, position: Optional[tuple] = None) -> None:
         """设置窗口相关配置"""
-        if width is not None:
-            self.set('window/width', width)
-        if height is not None:
-            self.set('window/height', height)
-        if maximized is not None:
-            self.set('window/maximized', maximized)
-        if position is not None:
-            self.set('window/position', position)
+        with self.batch():
+            if width is not None:
+                self.set('window/width', width)
+            if height is not None:
+                self.set('window/height', height)
+            if maximized is not None:
+                self.set('window/maximized', maximized)
+            if position is not None:
+                self.set('window/position', position)
     
     def get_ui_config(self) -> Dict[str, Any]:
         """获取UI相关配置"""
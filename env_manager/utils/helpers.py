@@ -6,35 +6,60 @@
 
 import os
 import re
+import sys
+import time
 import hashlib
-from typing import List, Dict, Optional, Union
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import List, Dict, Optional, Set, Tuple, Union
 from pathlib import Path
 
 from .constants import PATH_SEPARATOR, MAX_SINGLE_PATH_LENGTH
 
 
+# 预编译的正则表达式
+_ILLEGAL_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')  # Windows文件名中的非法字符
+_VAR_NAME_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')  # 环境变量名：字母、数字、下划线
+
+# validate_path的结果缓存: 路径 -> (是否有效, 检查时间)，超过有效期后重新访问文件系统
+_PATH_VALID_CACHE: Dict[str, Tuple[bool, float]] = {}
+_PATH_VALID_TTL = 5.0  # 缓存有效期（秒）
+_PATH_VALID_CACHE_SIZE = 4096  # 缓存条目上限，超出时整体清空
+_PATH_CHECK_WORKERS = 16  # 批量检查路径存在性时的最大线程数
+
+# ensure_directory已确认存在的目录
+_ensured_directories: Set[str] = set()
+
+# 校验和不用于安全用途，Python 3.9+声明后在FIPS模式下也可使用MD5
+_md5 = partial(hashlib.md5, usedforsecurity=False) if sys.version_info >= (3, 9) else hashlib.md5
+
+
 def ensure_directory(directory: str) -> None:
-    """确保目录存在，不存在则创建"""
+    """确保目录存在，不存在则创建（同一目录只在首次调用时访问文件系统）"""
+    if directory in _ensured_directories:
+        return
     Path(directory).mkdir(parents=True, exist_ok=True)
+    _ensured_directories.add(directory)
 
 
 def sanitize_filename(filename: str) -> str:
     """清理文件名，移除非法字符"""
     # 移除或替换Windows文件名中的非法字符
-    illegal_chars = r'[<>:"/\\|?*]'
-    return re.sub(illegal_chars, '_', filename)
+    return _ILLEGAL_FILENAME_RE.sub('_', filename)
+
+
+# 文件大小单位表，下标为以1024为底的数量级
+_SIZE_UNITS = (('B', 1), ('KB', 1024), ('MB', 1024 ** 2), ('GB', 1024 ** 3))
 
 
 def format_size(size_bytes: int) -> str:
     """格式化文件大小显示"""
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+    # 由二进制位数直接得到数量级，代替逐级比较
+    unit, divisor = _SIZE_UNITS[min((int(size_bytes).bit_length() - 1) // 10, 3)]
+    return f"{size_bytes / divisor:.1f} {unit}"
 
 
 def truncate_text(text: str, max_length: int = 50, suffix: str = "...") -> str:
@@ -44,8 +69,9 @@ def truncate_text(text: str, max_length: int = 50, suffix: str = "...") -> str:
     return text[:max_length - len(suffix)] + suffix
 
 
+@lru_cache(maxsize=4096)
 def normalize_path(path: str) -> str:
-    """标准化路径格式"""
+    """标准化路径格式（纯字符串处理，结果按输入缓存）"""
     if not path:
         return ""
     
@@ -56,7 +82,7 @@ def normalize_path(path: str) -> str:
     if path.startswith('"') and path.endswith('"'):
         path = path[1:-1]
     
-    # 标准化路径分隔符
+    # 标准化路径分隔符（不含'/'时replace直接返回原字符串，不产生新对象）
     path = path.replace('/', '\\')
     
     # 移除末尾的反斜杠（除了根目录）
@@ -67,20 +93,33 @@ def normalize_path(path: str) -> str:
 
 
 def validate_path(path: str) -> bool:
-    """验证路径是否有效"""
+    """验证路径是否有效（结果在短时间内缓存，避免重复访问文件系统）"""
     if not path:
         return False
     
+    now = time.monotonic()
+    cached = _PATH_VALID_CACHE.get(path)
+    if cached is not None and now - cached[1] < _PATH_VALID_TTL:
+        return cached[0]
+    
+    if len(_PATH_VALID_CACHE) >= _PATH_VALID_CACHE_SIZE:
+        _PATH_VALID_CACHE.clear()
+    result = _check_path(path)
+    _PATH_VALID_CACHE[path] = (result, now)
+    return result
+
+
+def invalidate_path_cache() -> None:
+    """清除路径验证缓存，下次验证时重新检查文件系统"""
+    _PATH_VALID_CACHE.clear()
+
+
+def _check_path(path: str) -> bool:
+    """检查路径格式并确认路径存在"""
     try:
         normalized = normalize_path(path)
         
-        # 检查路径长度
-        if len(normalized) > MAX_SINGLE_PATH_LENGTH:
-            return False
-        
-        # 检查是否包含非法字符
-        illegal_chars = '<>"|*?'
-        if any(char in normalized for char in illegal_chars):
+        if not _is_path_format_valid(normalized):
             return False
         
         # 检查路径是否存在
@@ -90,18 +129,102 @@ def validate_path(path: str) -> bool:
         return False
 
 
+def _is_path_format_valid(normalized: str) -> bool:
+    """检查标准化后的路径格式（长度和非法字符）"""
+    # 检查路径长度
+    if len(normalized) > MAX_SINGLE_PATH_LENGTH:
+        return False
+    
+    # 检查是否包含非法字符
+    illegal_chars = '<>"|*?'
+    return not any(char in normalized for char in illegal_chars)
+
+
+def batch_validate_paths(paths: List[str]) -> List[bool]:
+    """批量验证路径，结果与validate_path逐个调用一致
+    
+    格式检查在内存中完成，存在性检查交给batch_path_exists按父目录合并。
+    """
+    candidates = []
+    for path in paths:
+        normalized = normalize_path(path) if path else ""
+        candidates.append(normalized if normalized and _is_path_format_valid(normalized) else "")
+    
+    try:
+        return batch_path_exists(candidates)
+    except ValueError:
+        return [validate_path(path) for path in paths]
+
+
+def batch_path_exists(paths: List[str]) -> List[bool]:
+    """批量检查路径是否存在
+    
+    按父目录分组，被多个路径共享的父目录只调用一次os.scandir，
+    其余情况（或父目录无法列出时）回退到os.path.exists。
+    各组的文件系统访问在线程池中并发进行，网络路径等慢速访问的等待时间相互重叠。
+    """
+    results = [False] * len(paths)
+    groups: Dict[str, List[tuple]] = defaultdict(list)
+    singles: List[List[tuple]] = []  # 无法按父目录分组的路径，各自单独检查
+    
+    # 循环内使用局部绑定，避免重复的全局和属性查找
+    split = os.path.split
+    normcase = os.path.normcase
+    
+    for index, path in enumerate(paths):
+        if not path:
+            continue
+        parent, name = split(path)
+        if not parent or name in ('', '.', '..'):
+            singles.append([(index, path, None, name)])
+        else:
+            groups[normcase(parent)].append((index, path, parent, name))
+    
+    jobs = list(groups.values()) + singles
+    if len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=min(_PATH_CHECK_WORKERS, len(jobs))) as executor:
+            checked = list(executor.map(_check_path_group, jobs))
+    else:
+        checked = [_check_path_group(items) for items in jobs]
+    
+    for group_results in checked:
+        for index, exists in group_results:
+            results[index] = exists
+    
+    return results
+
+
+def _check_path_group(items: List[tuple]) -> List[Tuple[int, bool]]:
+    """检查同一父目录下的一组路径，返回(下标, 是否存在)列表"""
+    exists = os.path.exists
+    normcase = os.path.normcase
+    
+    entries = None
+    if len(items) > 1:
+        try:
+            with os.scandir(items[0][2]) as it:
+                entries = {normcase(entry.name) for entry in it}
+        except OSError:
+            entries = None
+    
+    if entries is None:
+        return [(index, exists(path)) for index, path, parent, name in items]
+    return [(index, normcase(name) in entries) for index, path, parent, name in items]
+
+
 def split_path_value(path_value: str) -> List[str]:
     """分割PATH值为路径列表"""
     if not path_value:
         return []
     
-    paths = []
-    for path in path_value.split(PATH_SEPARATOR):
-        path = path.strip()
-        if path:  # 排除空字符串
-            paths.append(normalize_path(path))
+    # 大多数变量不含分隔符，直接按单个路径处理
+    if PATH_SEPARATOR not in path_value:
+        normalized = normalize_path(path_value)
+        return [normalized] if normalized else []
     
-    return paths
+    # normalize_path已去除首尾空白，无需先单独strip；排除空字符串
+    return [normalized for path in path_value.split(PATH_SEPARATOR)
+            if (normalized := normalize_path(path))]
 
 
 def join_path_value(paths: List[str]) -> str:
@@ -121,21 +244,17 @@ def join_path_value(paths: List[str]) -> str:
 
 def remove_duplicate_paths(paths: List[str]) -> List[str]:
     """移除重复的路径（保持顺序）"""
-    seen = set()
-    result = []
-    
+    # 字典保持插入顺序，setdefault保留每个路径第一次出现的原始写法
+    unique: Dict[str, str] = {}
     for path in paths:
-        normalized = normalize_path(path).lower()
-        if normalized not in seen:
-            seen.add(normalized)
-            result.append(path)
+        unique.setdefault(normalize_path(path).lower(), path)
     
-    return result
+    return list(unique.values())
 
 
 def calculate_md5(text: str) -> str:
-    """计算文本的MD5哈希值"""
-    return hashlib.md5(text.encode('utf-8')).hexdigest()
+    """计算文本的MD5哈希值（用于备份校验）"""
+    return _md5(text.encode('utf-8')).hexdigest()
 
 
 def is_valid_var_name(name: str) -> bool:
@@ -152,7 +271,7 @@ def is_valid_var_name(name: str) -> bool:
         return False
     
     # 只能包含字母、数字、下划线
-    return re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', name) is not None
+    return _VAR_NAME_RE.match(name) is not None
 
 
 def format_env_value_display(value: str, max_length: int = 100) -> str:
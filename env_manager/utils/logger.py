@@ -4,16 +4,119 @@
 提供应用程序的日志记录功能。
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import traceback
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .constants import LOG_DIR, APP_NAME
 from .helpers import ensure_directory
 
 
+# 按日志文件共享的队列处理器：每个文件只有一组实际处理器和一个后台写入线程，
+# 调用线程只把记录放入队列，不再同步等待磁盘写入
+_queue_handlers: Dict[str, logging.handlers.QueueHandler] = {}
+_queue_listeners: List[logging.handlers.QueueListener] = []
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """使用大缓冲区的轮转文件处理器
+    
+    写入记录后不立即刷新，由后台日志线程在队列空闲时调用flush()。
+    轮转判断使用自行累计的写入量，避免每条记录都通过tell()强制刷新缓冲区。
+    """
+    
+    BUFFER_SIZE = 128 * 1024  # 写缓冲区大小（字节）
+    
+    def __init__(self, *args, **kwargs):
+        self._written: Optional[int] = None  # 当前文件的字节数，None表示需要重新获取
+        super().__init__(*args, **kwargs)
+    
+    def _open(self):
+        self._written = None
+        # FileHandler从Python 3.9起才有errors属性
+        return open(self.baseFilename, self.mode, buffering=self.BUFFER_SIZE,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+    
+    def _current_size(self) -> int:
+        """当前文件的字节数，仅在打开文件后取一次实际大小"""
+        if self.stream is None:
+            self.stream = self._open()
+        if self._written is None:
+            self._written = self.stream.seek(0, 2)
+        return self._written
+    
+    def _encoded_size(self, msg: str) -> int:
+        """消息写入文件后占用的字节数（按文件编码，并计入Windows的换行转换）"""
+        size = len(msg.encode(self.encoding or 'utf-8', getattr(self, 'errors', None) or 'strict'))
+        if os.linesep != '\n':
+            size += msg.count('\n') * (len(os.linesep) - 1)
+        return size
+    
+    def shouldRollover(self, record) -> bool:
+        if self.maxBytes <= 0:
+            return False
+        msg = self.format(record) + self.terminator
+        return self._current_size() + self._encoded_size(msg) >= self.maxBytes
+    
+    def emit(self, record):
+        """写入记录但不刷新缓冲区"""
+        try:
+            msg = self.format(record) + self.terminator
+            size = self._encoded_size(msg)
+            if self.maxBytes > 0 and self._current_size() + size >= self.maxBytes:
+                self.doRollover()
+            
+            written = self._current_size()
+            self.stream.write(msg)
+            self._written = written + size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _IdleFlushQueueListener(logging.handlers.QueueListener):
+    """队列取空时才刷新处理器，突发的日志记录在缓冲区中合并写入"""
+    
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+
+def _get_queue_handler(log_file: str,
+                       create_handlers: Callable[[], Tuple[logging.Handler, ...]]) -> logging.handlers.QueueHandler:
+    """获取写入指定日志文件的队列处理器，首次使用时创建处理器并启动后台线程"""
+    handler = _queue_handlers.get(log_file)
+    if handler is None:
+        log_queue = queue.SimpleQueue()
+        listener = _IdleFlushQueueListener(
+            log_queue, *create_handlers(), respect_handler_level=True
+        )
+        listener.start()
+        _queue_listeners.append(listener)
+        
+        handler = logging.handlers.QueueHandler(log_queue)
+        _queue_handlers[log_file] = handler
+    return handler
+
+
+def stop_log_listeners() -> None:
+    """停止后台日志线程，队列中剩余的记录会先全部写出"""
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+    _queue_handlers.clear()
+
+
+atexit.register(stop_log_listeners)
+
+
 def setup_logger(name: str = APP_NAME, 
                 level: str = 'INFO',
                 log_file: str = None,
@@ -46,8 +149,19 @@ def setup_logger(name: str = APP_NAME,
     if log_file is None:
         log_file = os.path.join(LOG_DIR, f"{APP_NAME}.log")
     
+    # 添加处理器到日志器（同一文件的日志器共享一个队列处理器）
+    logger.addHandler(_get_queue_handler(
+        log_file, lambda: _create_log_handlers(log_file, max_file_size, backup_count)
+    ))
+    
+    return logger
+
+
+def _create_log_handlers(log_file: str, max_file_size: int,
+                         backup_count: int) -> Tuple[logging.Handler, logging.Handler]:
+    """创建主日志的文件处理器和控制台处理器"""
     # 创建文件处理器（带轮转）
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = BufferedRotatingFileHandler(
         log_file,
         maxBytes=max_file_size,
         backupCount=backup_count,
@@ -72,11 +186,7 @@ def setup_logger(name: str = APP_NAME,
     file_handler.setFormatter(file_formatter)
     console_handler.setFormatter(console_formatter)
     
-    # 添加处理器到日志器
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
-    return logger
+    return file_handler, console_handler
 
 
 def get_logger(name: str = None) -> logging.Logger:
@@ -108,8 +218,17 @@ class OperationLogger:
         self.logger = get_logger(f"{APP_NAME}.operation")
         self.audit_file = os.path.join(LOG_DIR, "audit.log")
         
-        # 创建审计日志处理器
-        audit_handler = logging.handlers.RotatingFileHandler(
+        # 创建专门的审计日志器，经队列写入审计日志文件
+        self.audit_logger = logging.getLogger(f"{APP_NAME}.audit")
+        self.audit_logger.setLevel(logging.INFO)
+        self.audit_logger.addHandler(_get_queue_handler(self.audit_file, self._create_audit_handlers))
+        
+        # 防止传播到根日志器
+        self.audit_logger.propagate = False
+    
+    def _create_audit_handlers(self) -> Tuple[logging.Handler]:
+        """创建审计日志处理器"""
+        audit_handler = BufferedRotatingFileHandler(
             self.audit_file,
             maxBytes=5 * 1024 * 1024,  # 5MB
             backupCount=10,
@@ -121,14 +240,7 @@ class OperationLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         audit_handler.setFormatter(audit_formatter)
-        
-        # 创建专门的审计日志器
-        self.audit_logger = logging.getLogger(f"{APP_NAME}.audit")
-        self.audit_logger.setLevel(logging.INFO)
-        self.audit_logger.addHandler(audit_handler)
-        
-        # 防止传播到根日志器
-        self.audit_logger.propagate = False
+        return (audit_handler,)
     
     def log_operation(self, operation: str, target: str, details: str = None, 
                      success: bool = True) -> None:
@@ -141,20 +253,26 @@ class OperationLogger:
             details: 操作详情
             success: 操作是否成功
         """
-        status = "SUCCESS" if success else "FAILED"
-        message = f"{operation} - {target} - {status}"
+        level = logging.INFO if success else logging.ERROR
+        log_main = self.logger.isEnabledFor(level)
+        log_audit = self.audit_logger.isEnabledFor(logging.INFO)
+        if not (log_main or log_audit):
+            return
         
+        # 使用延迟格式化，消息只在记录实际被处理时才拼接
+        status = "SUCCESS" if success else "FAILED"
         if details:
-            message += f" - {details}"
+            message, args = "%s - %s - %s - %s", (operation, target, status, details)
+        else:
+            message, args = "%s - %s - %s", (operation, target, status)
         
         # 记录到主日志
-        if success:
-            self.logger.info(message)
-        else:
-            self.logger.error(message)
+        if log_main:
+            self.logger.log(level, message, *args)
         
         # 记录到审计日志
-        self.audit_logger.info(message)
+        if log_audit:
+            self.audit_logger.info(message, *args)
     
     def log_env_create(self, name: str, env_type: str, success: bool = True) -> None:
         """记录环境变量创建"""
@@ -187,8 +305,16 @@ class OperationLogger:
         self.log_operation("EXPORT", file_path, details, success)
 
 
-# 全局操作日志器实例
-operation_logger = OperationLogger()
+# 全局操作日志器实例，首次使用时才创建（避免导入模块时就打开日志文件）
+_operation_logger: Optional[OperationLogger] = None
+
+
+def get_operation_logger() -> OperationLogger:
+    """获取全局操作日志器"""
+    global _operation_logger
+    if _operation_logger is None:
+        _operation_logger = OperationLogger()
+    return _operation_logger
 
 
 def log_exception(logger: logging.Logger, exception: Exception, 
@@ -201,8 +327,6 @@ def log_exception(logger: logging.Logger, exception: Exception,
         exception: 异常对象
         context: 异常上下文信息
     """
-    import traceback
-    
     error_msg = f"Exception occurred: {type(exception).__name__}: {str(exception)}"
     
     if context:
@@ -254,13 +378,11 @@ def cleanup_old_logs(days: int = 30) -> None:
         current_time = time.time()
         cutoff_time = current_time - (days * 24 * 60 * 60)
         
-        for filename in os.listdir(LOG_DIR):
-            file_path = os.path.join(LOG_DIR, filename)
-            
-            if os.path.isfile(file_path):
-                file_time = os.path.getmtime(file_path)
-                if file_time < cutoff_time:
-                    os.remove(file_path)
+        # scandir的目录项自带文件类型和stat信息，无需对每个文件单独stat
+        with os.scandir(LOG_DIR) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.stat().st_mtime < cutoff_time:
+                    os.remove(entry.path)
                     
     except Exception as e:
         logger = get_logger()
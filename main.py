@@ -14,9 +14,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 try:
-    from PySide6.QtWidgets import QApplication, QMessageBox
+    from PySide6.QtWidgets import QApplication, QMessageBox, QSplashScreen
     from PySide6.QtCore import Qt, QSettings
-    from PySide6.QtGui import QIcon
+    from PySide6.QtGui import QIcon, QPixmap
 except ImportError as e:
     print(f"错误: 无法导入PySide6库: {e}")
     print("请运行以下命令安装依赖:")
@@ -32,51 +32,51 @@ from env_manager.utils.helpers import ensure_directory
 class SingletonApplication:
     """单例应用程序类，确保只有一个实例运行"""
     
+    # 命名互斥体，进程退出时由系统自动释放
+    MUTEX_NAME = "Global\\EnvManagerSingletonMutex"
+    ERROR_ALREADY_EXISTS = 183
+    
     def __init__(self):
         self.settings = QSettings("EnvManager", "SingleInstance")
         self.is_running = False
+        self._mutex_handle = None
     
     def check_running(self) -> bool:
         """检查应用程序是否已经在运行"""
-        # 简单的单例检查机制
-        lock_file = os.path.join(CONFIG_DIR, "app.lock")
-        
+        # 使用系统命名互斥体判断，无需锁文件和进程检查
         try:
-            if os.path.exists(lock_file):
-                # 检查进程是否真的在运行
-                with open(lock_file, 'r') as f:
-                    pid = int(f.read().strip())
-                
-                # 在Windows上检查进程是否存在
-                import psutil
-                if psutil.pid_exists(pid):
-                    return True
-                else:
-                    # 进程不存在，删除锁文件
-                    os.remove(lock_file)
+            import ctypes
+            kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+            kernel32.CreateMutexW.restype = ctypes.c_void_p
+            kernel32.CreateMutexW.argtypes = [ctypes.c_void_p, ctypes.c_bool, ctypes.c_wchar_p]
             
-            # 创建新的锁文件
-            ensure_directory(CONFIG_DIR)
-            with open(lock_file, 'w') as f:
-                f.write(str(os.getpid()))
+            handle = kernel32.CreateMutexW(None, False, self.MUTEX_NAME)
+            if not handle:
+                # 创建失败时，假设没有运行
+                self.is_running = False
+                return False
             
-            self.is_running = False
-            return False
+            # 保留句柄，使互斥体在本进程存活期间一直存在
+            self._mutex_handle = handle
+            self.is_running = ctypes.get_last_error() == self.ERROR_ALREADY_EXISTS
+            return self.is_running
             
-        except (IOError, ValueError, ImportError):
-            # 如果检查失败，假设没有运行
+        except (AttributeError, OSError):
+            # 非Windows平台或检查失败，假设没有运行
             self.is_running = False
             return False
     
     def cleanup(self):
         """清理资源"""
-        if not self.is_running:
-            lock_file = os.path.join(CONFIG_DIR, "app.lock")
+        if self._mutex_handle:
             try:
-                if os.path.exists(lock_file):
-                    os.remove(lock_file)
-            except OSError:
+                import ctypes
+                kernel32 = ctypes.WinDLL("kernel32")
+                kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+                kernel32.CloseHandle(self._mutex_handle)
+            except (AttributeError, OSError):
                 pass
+            self._mutex_handle = None
 
 
 def check_admin_privileges() -> bool:
@@ -134,6 +134,24 @@ def setup_application() -> QApplication:
     return app
 
 
+def show_splash_screen() -> QSplashScreen:
+    """显示启动画面，在导入和创建主界面期间给出反馈"""
+    pixmap = QPixmap(360, 120)
+    pixmap.fill(Qt.GlobalColor.white)
+    
+    splash = QSplashScreen(pixmap)
+    splash.showMessage(
+        f"{APP_NAME} v{APP_VERSION}\n正在加载...",
+        Qt.AlignmentFlag.AlignCenter,
+        Qt.GlobalColor.black
+    )
+    splash.show()
+    
+    # 立即绘制启动画面，之后再执行耗时的导入
+    QApplication.processEvents()
+    return splash
+
+
 def parse_arguments():
     """解析命令行参数"""
     parser = argparse.ArgumentParser(
@@ -189,6 +207,7 @@ def main():
     logger = setup_logger(level=log_level)
     logger.info(f"启动 {APP_NAME} v{APP_VERSION}")
     
+    splash = None
     try:
         # 检查单例
         singleton = SingletonApplication()
@@ -213,6 +232,9 @@ def main():
         # 设置应用程序
         app = setup_application()
         
+        # 先显示启动画面，主界面模块在其后才导入
+        splash = show_splash_screen()
+        
         # 初始化配置管理器
         config_manager = ConfigManager()
         logger.info("配置管理器初始化完成")
@@ -245,10 +267,13 @@ def main():
                         x, y = int(pos[0]), int(pos[1])
                         main_window.move(x, y)
             
+            splash.finish(main_window)
+            splash = None
             logger.info("应用程序界面初始化完成")
             
             # 设置应用程序退出时的清理函数
             def cleanup():
+                main_window.config_manager.flush()
                 singleton.cleanup()
                 logger.info("应用程序退出")
             
@@ -262,6 +287,7 @@ def main():
             
         except ImportError as e:
             logger.error(f"无法导入主窗口模块: {e}")
+            splash.close()
             QMessageBox.critical(
                 None,
                 "导入错误",
@@ -272,6 +298,9 @@ def main():
     except Exception as e:
         logger.error(f"应用程序启动失败: {e}", exc_info=True)
         
+        if splash is not None:
+            splash.close()
+        
         # 显示错误对话框
         try:
             app = QApplication.instance()
@@ -4,12 +4,37 @@
 用于测试EditDialog的功能。
 """
 
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QPushButton, QVBoxLayout, QWidget, QHBoxLayout
-from PySide6.QtCore import Qt
+from functools import lru_cache
+from typing import Tuple
+from PySide6.QtWidgets import QApplication, QPushButton, QVBoxLayout, QWidget, QHBoxLayout, QLabel
+from PySide6.QtCore import Qt, Slot
 
 from env_manager.models.env_model import EnvironmentVariable, EnvType
-from env_manager.ui.dialogs.edit_dialog import EditDialog
+
+
+# 示例PATH变量的值（导入时构建一次）
+_SAMPLE_PATHS = (
+    "C:\\Windows\\System32",
+    "C:\\Windows",
+    "C:\\Program Files\\Git\\bin",
+    "C:\\Python39",
+    "C:\\Python39\\Scripts"
+)
+_SAMPLE_PATH_VALUE = ";".join(_SAMPLE_PATHS)
+
+# 变量类型的显示名称
+_ENV_TYPE_LABELS = {EnvType.SYSTEM: "系统变量", EnvType.USER: "用户变量"}
+
+
+@lru_cache(maxsize=16)
+def _format_meta(env_type: EnvType, is_new: bool, is_modified: bool) -> Tuple[str, str]:
+    """格式化变量的类型行和状态行（输入组合有限，结果全部缓存）"""
+    return (
+        f"  类型: {_ENV_TYPE_LABELS[env_type]}",
+        f"  是否新建: {is_new}\n  是否修改: {is_modified}",
+    )
 
 
 class TestWindow(QWidget):
@@ -20,8 +45,20 @@ class TestWindow(QWidget):
         self.setWindowTitle("测试环境变量编辑对话框")
         self.setMinimumSize(400, 200)
         
-        # 创建布局
-        layout = QVBoxLayout(self)
+        # 示例变量只创建一次，编辑对话框只读取它们，保存时会创建新对象
+        self._sample_user_var = EnvironmentVariable(
+            name="TEST_USER_VAR",
+            value="这是一个测试用户变量",
+            env_type=EnvType.USER
+        )
+        self._sample_path_var = EnvironmentVariable(
+            name="PATH",
+            value=_SAMPLE_PATH_VALUE,
+            env_type=EnvType.SYSTEM
+        )
+        
+        # 创建布局（最后统一设置到窗口上）
+        layout = QVBoxLayout()
         
         # 添加标题
         layout.addWidget(QPushButton("环境变量编辑对话框测试"))
@@ -47,77 +84,74 @@ class TestWindow(QWidget):
         layout.addLayout(button_layout)
         
         # 结果显示
-        self.result_btn = QPushButton("最后编辑结果会显示在这里")
-        self.result_btn.setEnabled(False)
-        layout.addWidget(self.result_btn)
+        self.result_label = QLabel("最后编辑结果会显示在这里")
+        layout.addWidget(self.result_label)
+        
+        self.setLayout(layout)
     
+    @Slot()
     def test_new_variable(self):
         """测试新建变量"""
+        from env_manager.ui.dialogs.edit_dialog import EditDialog
+        
         dialog = EditDialog(self)
         dialog.variable_saved.connect(self.on_variable_saved)
         dialog.exec()
     
+    @Slot()
     def test_edit_user_variable(self):
         """测试编辑用户变量"""
-        # 创建一个示例用户变量
-        sample_var = EnvironmentVariable(
-            name="TEST_USER_VAR",
-            value="这是一个测试用户变量",
-            env_type=EnvType.USER
-        )
+        from env_manager.ui.dialogs.edit_dialog import EditDialog
         
-        dialog = EditDialog(self, sample_var)
+        dialog = EditDialog(self, self._sample_user_var)
         dialog.variable_saved.connect(self.on_variable_saved)
         dialog.exec()
     
+    @Slot()
     def test_edit_path_variable(self):
         """测试编辑PATH变量"""
-        # 创建一个示例PATH变量
-        sample_paths = [
-            "C:\\Windows\\System32",
-            "C:\\Windows",
-            "C:\\Program Files\\Git\\bin",
-            "C:\\Python39",
-            "C:\\Python39\\Scripts"
-        ]
-        path_value = ";".join(sample_paths)
-        
-        sample_var = EnvironmentVariable(
-            name="PATH",
-            value=path_value,
-            env_type=EnvType.SYSTEM
-        )
+        from env_manager.ui.dialogs.edit_dialog import EditDialog
         
-        dialog = EditDialog(self, sample_var)
+        dialog = EditDialog(self, self._sample_path_var)
         dialog.variable_saved.connect(self.on_variable_saved)
         dialog.exec()
     
+    @Slot(EnvironmentVariable)
     def on_variable_saved(self, variable: EnvironmentVariable):
         """处理变量保存"""
-        result_text = f"保存成功: {variable.name} = {variable.value[:50]}..."
-        if len(variable.value) > 50:
-            result_text += f" (共{len(variable.value)}字符)"
+        value = variable.value
+        length = len(value)
+        tail = f" (共{length}字符)" if length > 50 else ""
+        result_text = f"保存成功: {variable.name} = {value[:50]}...{tail}"
         
-        self.result_btn.setText(result_text)
-        print(f"变量保存成功:")
-        print(f"  名称: {variable.name}")
-        print(f"  类型: {'系统变量' if variable.env_type == EnvType.SYSTEM else '用户变量'}")
-        print(f"  值: {variable.value}")
-        print(f"  是否新建: {variable.is_new}")
-        print(f"  是否修改: {variable.is_modified}")
-        print("-" * 50)
+        self.result_label.setText(result_text)
+        # 拼接后一次输出
+        type_line, state_lines = _format_meta(variable.env_type, variable.is_new, variable.is_modified)
+        print("\n".join((
+            "变量保存成功:",
+            f"  名称: {variable.name}",
+            type_line,
+            f"  值: {value}",
+            state_lines,
+            "-" * 50,
+        )))
 
 
 def main():
     """主函数"""
+    # 测试脚本不需要会话管理和无障碍支持，在创建QApplication前关闭
+    os.environ.setdefault("QT_ACCESSIBILITY", "0")
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_DisableSessionManager)
     app = QApplication(sys.argv)
     
     # 创建测试窗口
     window = TestWindow()
     window.show()
     
-    # 运行应用程序
-    sys.exit(app.exec())
+    # 运行应用程序，退出前先释放窗口，使其在QApplication仍存在时销毁
+    exit_code = app.exec()
+    del window
+    raise SystemExit(exit_code)
 
 
 if __name__ == "__main__":
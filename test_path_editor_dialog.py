@@ -11,25 +11,37 @@ import os
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, project_root)
 
-from PySide6.QtWidgets import QApplication, QMessageBox
-from env_manager.ui.dialogs.path_editor_dialog import PathEditorDialog
-from env_manager.models.env_model import EnvType
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt, Slot
+
+
+@Slot(str)
+def on_path_updated(path_value):
+    """处理PATH值更新"""
+    from PySide6.QtWidgets import QMessageBox
+    
+    length = len(path_value)
+    print(f"PATH值已更新: {length} 字符")
+    QMessageBox.information(None, "PATH更新", f"PATH值已更新，包含 {length} 个字符")
 
 
 def test_path_editor_dialog():
     """测试PATH编辑器对话框"""
     print("启动PATH编辑器对话框测试...")
     
+    # 测试脚本不需要会话管理和无障碍支持，在创建QApplication前关闭
+    os.environ.setdefault("QT_ACCESSIBILITY", "0")
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_DisableSessionManager)
     app = QApplication(sys.argv)
     
+    # 项目模块在QApplication创建后才导入
+    from env_manager.models.env_model import EnvType
+    from env_manager.ui.dialogs.path_editor_dialog import PathEditorDialog
+    
     # 创建对话框（用户变量）
     dialog = PathEditorDialog(env_type=EnvType.USER)
     
     # 连接信号
-    def on_path_updated(path_value):
-        print(f"PATH值已更新: {len(path_value)} 字符")
-        QMessageBox.information(None, "PATH更新", f"PATH值已更新，包含 {len(path_value)} 个字符")
-    
     dialog.path_updated.connect(on_path_updated)
     
     # 显示对话框